@@ -45,7 +45,10 @@ from backend.services.portfolio_manager_async import (
 )
 
 # Använd bara fetch_positions_async från positions_service_async
-from backend.services.positions_service_async import fetch_positions_async
+from backend.services.positions_service_async import (
+    fetch_positions_async,
+    fetch_positions_payload_async,
+)
 from backend.services.risk_manager_async import (
     RiskManagerAsync,
     RiskParameters,
@@ -636,7 +639,7 @@ async def get_portfolio_manager(
     if not strategy_weights:
         strategy_weights = [StrategyWeight(strategy_name="default", weight=1.0)]
 
-    return await get_portfolio_manager_async(risk_manager, strategy_weights)
+    return get_portfolio_manager_async(risk_manager, strategy_weights)
 
 
 # Risk manager (legacy function name, renamed to avoid conflict)
@@ -694,3 +697,15 @@ def get_positions_service_async() -> Callable:
     Callable: The fetch_positions_async function from positions_service_async
     """
     return fetch_positions_async
+
+
+def get_positions_payload_service_async() -> Callable:
+    """
+    Get the async positions service function that includes the encoded body.
+
+    Returns:
+    --------
+    Callable: The fetch_positions_payload_async function from
+    positions_service_async
+    """
+    return fetch_positions_payload_async
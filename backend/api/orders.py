@@ -9,18 +9,23 @@ from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 
 from backend.api.dependencies import get_order_service
 from backend.api.models import OrderCreateModel
+from backend.api.responses import FastJSONResponse
 from backend.services.order_service_async import OrderServiceAsync
 
 # Create router
 router = APIRouter(
     prefix="/api",
     tags=["orders"],
+    default_response_class=FastJSONResponse,
 )
 
 
 @router.get("/orders", response_model=Dict[str, List[Dict[str, Any]]])
 async def get_orders(
     symbol: Optional[str] = Query(None, description="Filter orders by symbol"),
+    symbols: Optional[str] = Query(
+        None, description="Comma-separated symbols to fetch in one batch"
+    ),
     status_filter: Optional[str] = Query(
         None, description="Filter orders by status", alias="status"
     ),
@@ -32,6 +37,7 @@ async def get_orders(
 
     Args:
         symbol: Filter orders by symbol
+        symbols: Comma-separated symbols, fetched concurrently
         status_filter: Filter orders by status
         limit: Maximum number of orders to return
         order_service: Order service dependency
@@ -40,7 +46,14 @@ async def get_orders(
         Dict with orders list
     """
     # Get open orders from the service
-    open_orders = await order_service.get_open_orders(symbol)
+    if symbols:
+        symbol_list = [s.strip() for s in symbols.split(",") if s.strip()]
+        orders_by_symbol = await order_service.get_open_orders_multi(symbol_list)
+        open_orders = [
+            order for orders in orders_by_symbol.values() for order in orders
+        ]
+    else:
+        open_orders = await order_service.get_open_orders(symbol)
 
     # Apply status filter if provided
     if status_filter:
@@ -125,6 +138,25 @@ async def place_order(
         )
 
 
+@router.post("/orders/cancel", response_model=Dict[str, Dict[str, bool]])
+async def cancel_orders(
+    order_ids: List[str] = Body(..., embed=True, description="Order IDs to cancel"),
+    order_service: OrderServiceAsync = Depends(get_order_service),
+) -> Dict[str, Dict[str, bool]]:
+    """
+    Cancel several orders in one request.
+
+    Args:
+        order_ids: Order IDs to cancel
+        order_service: Order service dependency
+
+    Returns:
+        Dict with the cancellation result per order ID
+    """
+    results = await order_service.cancel_orders(order_ids)
+    return {"results": results}
+
+
 @router.delete("/orders/{order_id}", response_model=Dict[str, Any])
 async def cancel_order(
     order_id: str,
@@ -1,10 +1,11 @@
 """API routes for positions management with FastAPI."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
 
-from backend.api.dependencies import get_positions_service_async
+from backend.api.dependencies import get_positions_payload_service_async
 from backend.api.models import PositionsResponse
 from backend.services.event_logger import (
     EventType,
@@ -16,11 +17,51 @@ from backend.services.exchange import ExchangeError
 # Create router
 router = APIRouter(prefix="/api/positions", tags=["positions"])
 
+# Returned instead of mock data when the exchange call fails
+_EMPTY_POSITIONS_BODY = b'{"positions":[]}'
+
+# Bodies checked against PositionsResponse, keyed by the id of the cached body
+# they were built from. The original body is kept alongside so its id cannot
+# be reused while the entry exists.
+_validated_bodies: Dict[int, Tuple[bytes, bytes]] = {}
+_MAX_VALIDATED_BODIES = 32
+
+
+def _validated_body(positions: List[Dict[str, Any]], body: bytes) -> bytes:
+    """
+    Validate a cached positions payload against the response model.
+
+    The response is sent pre-encoded, which bypasses FastAPI's
+    response_model validation, so the payload is validated here instead.
+    The service caches one body per exchange fetch, so each fetch is
+    validated once rather than on every request.
+
+    Args:
+        positions: Position list the body was encoded from
+        body: Encoded {"positions": [...]} body from the service
+
+    Returns:
+        Encoded body of the validated PositionsResponse
+
+    Raises:
+        pydantic.ValidationError: If a position does not match the model
+    """
+    entry = _validated_bodies.get(id(body))
+    if entry is not None and entry[0] is body:
+        return entry[1]
+
+    validated = PositionsResponse.model_validate({"positions": positions})
+    encoded = validated.model_dump_json().encode("utf-8")
+    if len(_validated_bodies) >= _MAX_VALIDATED_BODIES:
+        _validated_bodies.clear()
+    _validated_bodies[id(body)] = (body, encoded)
+    return encoded
+
 
 @router.get("/", response_model=PositionsResponse)
 async def get_positions(
     symbols: Optional[List[str]] = None,
-    fetch_positions_async=Depends(get_positions_service_async),
+    fetch_positions_payload_async=Depends(get_positions_payload_service_async),
 ):
     """
     Fetch current positions from Bitfinex.
@@ -37,8 +78,11 @@ async def get_positions(
     # Detta är routine polling - supprimerias enligt event_logger
 
     try:
-        # Attempt to fetch live positions from Bitfinex using async service
-        positions = await fetch_positions_async(symbols)
+        # Attempt to fetch live positions from Bitfinex using async service.
+        # The body is encoded and cached by the service, so it is validated
+        # once per fetch and then sent as is.
+        positions, body = await fetch_positions_payload_async(symbols)
+        body = _validated_body(positions, body)
 
         # Endast logga om det INTE är routine polling
         if not should_suppress_routine_log("/api/positions", "GET"):
@@ -47,14 +91,14 @@ async def get_positions(
                 f"Positions fetched: {len(positions)} positions",
             )
 
-        return {"positions": positions}
+        return Response(content=body, media_type="application/json")
 
     except ExchangeError as e:
         # FEL ska alltid loggas - de är meningsfulla
         event_logger.log_exchange_error("fetch_positions", str(e))
 
         # Return empty list rather than mock data for safety
-        return {"positions": []}
+        return Response(content=_EMPTY_POSITIONS_BODY, media_type="application/json")
 
     except Exception as e:
         # Kritiska fel ska alltid loggas
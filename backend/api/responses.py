@@ -0,0 +1,16 @@
+"""
+Response classes shared by API routers.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from backend.services.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is available."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -10,8 +10,10 @@ print(sys.path)
 
 import logging
 import os
+import queue
 import sys
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict
 
 # Lägg till projektroten i Python-sökvägen för att kunna importera backend-modulen
@@ -38,13 +40,47 @@ from backend.api import status as status_api
 from backend.api import trading_limitations as trading_limitations_api
 from backend.api import websocket as websocket_api
 from backend.services.exchange import ExchangeService
-from backend.services.exchange_async import create_mock_exchange_service
+from backend.services.exchange_async import (
+    close_http_client_async,
+    create_mock_exchange_service,
+)
 from backend.services.global_nonce_manager import get_global_nonce_manager
 
 # Konfigurera loggning
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _start_queued_logging() -> QueueListener:
+    """
+    Move the root logger's handlers behind a queue.
+
+    Log calls on the event loop then only merge the message arguments into
+    the record and enqueue it, while the handlers' formatting and the
+    stream/file writes run on the listener's thread.
+
+    Returns:
+        QueueListener: Running listener that owns the original handlers
+    """
+    root = logging.getLogger()
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+def _stop_queued_logging(listener: QueueListener) -> None:
+    """
+    Give the root logger its handlers back and drain the queue.
+
+    Args:
+        listener: Listener returned by _start_queued_logging
+    """
+    logging.getLogger().handlers = list(listener.handlers)
+    listener.stop()
+
+
 # Ladda miljövariabler från .env-fil om den finns
 env_file = os.environ.get("FASTAPI_ENV_FILE", None)
 if env_file and os.path.exists(env_file):
@@ -70,98 +106,112 @@ async def lifespan(app: FastAPI):
     """
     global exchange_service
 
-    # Kontrollera om WebSockets ska inaktiveras
-    disable_websockets = (
-        os.environ.get("FASTAPI_DISABLE_WEBSOCKETS", "false").lower() == "true"
-    )
-    if disable_websockets:
-        logger.info("⚠️ WebSockets är inaktiverade i denna konfiguration")
-
-    # Kontrollera om GlobalNonceManager ska inaktiveras
-    disable_nonce_manager = (
-        os.environ.get("FASTAPI_DISABLE_GLOBAL_NONCE_MANAGER", "false").lower()
-        == "true"
-    )
-    if disable_nonce_manager:
-        logger.info("⚠️ GlobalNonceManager är inaktiverad i denna konfiguration")
-
-    # Skapa mock exchange service för utveckling
-    logger.info("🔧 Använder mock exchange ")
-    exchange_service = create_mock_exchange_service()
-
-    # Initiera GlobalNonceManager om den inte är inaktiverad
-    if not disable_nonce_manager:
-        # get_global_nonce_manager är inte awaitable, så vi kallar den direkt
-        gnm = get_global_nonce_manager(dev_mode=dev_mode)
-        logger.info(f"🔐 Enhanced GlobalNonceManager initialized")
-
-    # Initiera BotManagerAsync för att förbereda för API-anrop
-    # Denna import görs här för att undvika cirkulära imports
-    from backend.services.bot_manager_async import get_bot_manager_async
-
-    bot_manager = await get_bot_manager_async(dev_mode=dev_mode)
-    logger.info(
-        f"🤖 BotManagerAsync initialized{' in development mode' if dev_mode else ''}"
-    )
-
-    # Initiera WebSocket-tjänster om de inte är inaktiverade
-    if not disable_websockets:
-        # Importera här för att undvika cirkelberoenden
-        from backend.services.websocket_market_service import get_websocket_client
+    # Skriv loggar från en egen tråd så att event-loopen inte blockeras av I/O
+    log_listener = _start_queued_logging()
 
-        # Initiera WebSocket-tjänster
-        ws_market = get_websocket_client()
-        logger.info("🔌 WebSocket Market tjänst initierad")
-
-        try:
-            # Importera och initiera WebSocket User Data om tillgänglig
-            from backend.services.websocket_user_data_service import (
-                get_websocket_user_data_service,
-            )
-
-            ws_user = await get_websocket_user_data_service()
-            logger.info("🔌 WebSocket User Data tjänst initierad")
-        except ImportError:
-            logger.warning(
-                "⚠️ WebSocket User Data tjänst kunde inte initieras (modulen saknas)"
-            )
-
-    yield
-
-    # Stoppa BotManagerAsync om den är igång
     try:
+        # Kontrollera om WebSockets ska inaktiveras
+        disable_websockets = (
+            os.environ.get("FASTAPI_DISABLE_WEBSOCKETS", "false").lower() == "true"
+        )
+        if disable_websockets:
+            logger.info("⚠️ WebSockets är inaktiverade i denna konfiguration")
+
+        # Kontrollera om GlobalNonceManager ska inaktiveras
+        disable_nonce_manager = (
+            os.environ.get("FASTAPI_DISABLE_GLOBAL_NONCE_MANAGER", "false").lower()
+            == "true"
+        )
+        if disable_nonce_manager:
+            logger.info("⚠️ GlobalNonceManager är inaktiverad i denna konfiguration")
+
+        # Skapa mock exchange service för utveckling
+        logger.info("🔧 Använder mock exchange ")
+        exchange_service = create_mock_exchange_service()
+
+        # Initiera GlobalNonceManager om den inte är inaktiverad
+        if not disable_nonce_manager:
+            # get_global_nonce_manager är inte awaitable, så vi kallar den direkt
+            gnm = get_global_nonce_manager(dev_mode=dev_mode)
+            logger.info(f"🔐 Enhanced GlobalNonceManager initialized")
+
+        # Initiera BotManagerAsync för att förbereda för API-anrop
+        # Denna import görs här för att undvika cirkulära imports
         from backend.services.bot_manager_async import get_bot_manager_async
 
         bot_manager = await get_bot_manager_async(dev_mode=dev_mode)
-        status = await bot_manager.get_status()
-        if status.get("status") == "running":
-            logger.info("🤖 Stopping BotManagerAsync")
-            await bot_manager.stop_bot()
-    except Exception as e:
-        logger.error(f"Error stopping BotManagerAsync: {e}")
-
-    # Stäng ner WebSocket-tjänster vid avstängning
-    if not disable_websockets:
-        try:
+        logger.info(
+            f"🤖 BotManagerAsync initialized{' in development mode' if dev_mode else ''}"
+        )
+
+        # Initiera WebSocket-tjänster om de inte är inaktiverade
+        if not disable_websockets:
             # Importera här för att undvika cirkelberoenden
-            from backend.services.websocket_market_service import stop_websocket_service
+            from backend.services.websocket_market_service import get_websocket_client
 
-            await stop_websocket_service()
-            logger.info("🔌 WebSocket Market tjänst stängd")
+            # Initiera WebSocket-tjänster
+            ws_market = get_websocket_client()
+            logger.info("🔌 WebSocket Market tjänst initierad")
 
-            # Stäng WebSocket User Data om tillgänglig
             try:
+                # Importera och initiera WebSocket User Data om tillgänglig
                 from backend.services.websocket_user_data_service import (
                     get_websocket_user_data_service,
                 )
 
                 ws_user = await get_websocket_user_data_service()
-                await ws_user.close()
-                logger.info("🔌 WebSocket User Data tjänst stängd")
+                logger.info("🔌 WebSocket User Data tjänst initierad")
             except ImportError:
-                pass
+                logger.warning(
+                    "⚠️ WebSocket User Data tjänst kunde inte initieras (modulen saknas)"
+                )
+
+        yield
+
+        # Stoppa BotManagerAsync om den är igång
+        try:
+            from backend.services.bot_manager_async import get_bot_manager_async
+
+            bot_manager = await get_bot_manager_async(dev_mode=dev_mode)
+            status = await bot_manager.get_status()
+            if status.get("status") == "running":
+                logger.info("🤖 Stopping BotManagerAsync")
+                await bot_manager.stop_bot()
         except Exception as e:
-            logger.error(f"Error stopping WebSocket services: {e}")
+            logger.error(f"Error stopping BotManagerAsync: {e}")
+
+        # Stäng ner WebSocket-tjänster vid avstängning
+        if not disable_websockets:
+            try:
+                # Importera här för att undvika cirkelberoenden
+                from backend.services.websocket_market_service import (
+                    stop_websocket_service,
+                )
+
+                await stop_websocket_service()
+                logger.info("🔌 WebSocket Market tjänst stängd")
+
+                # Stäng WebSocket User Data om tillgänglig
+                try:
+                    from backend.services.websocket_user_data_service import (
+                        get_websocket_user_data_service,
+                    )
+
+                    ws_user = await get_websocket_user_data_service()
+                    await ws_user.close()
+                    logger.info("🔌 WebSocket User Data tjänst stängd")
+                except ImportError:
+                    pass
+            except Exception as e:
+                logger.error(f"Error stopping WebSocket services: {e}")
+    finally:
+        # Stängs även om något steg ovan misslyckas, så att HTTP-klienten
+        # och loggtråden aldrig lämnas kvar
+        try:
+            # Stäng den delade HTTP-klienten för tickerhämtning
+            await close_http_client_async()
+        finally:
+            _stop_queued_logging(log_listener)
 
 
 # Skapa FastAPI-applikationen
@@ -248,6 +248,19 @@ class EnhancedCacheService:
         else:
             self.set(key, data)
 
+    def delete(self, key: str) -> bool:
+        """
+        Remove a single cache entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            return self._cache.pop(key, None) is not None
+
     def invalidate_pattern(self, pattern: str) -> int:
         """
         Invalidate all cache entries matching pattern.
@@ -1,8 +1,9 @@
 """Exchange service for cryptocurrency trading."""
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import ccxt
 
@@ -10,6 +11,31 @@ from backend.services.bitfinex_client_wrapper import BitfinexClientWrapper
 from backend.services.global_nonce_manager import get_global_nonce_manager
 from backend.services.symbol_converter import BitfinexSymbolConverter
 
+# Top-level keys of a ccxt balance response that are not currencies
+_BALANCE_METADATA_KEYS = frozenset(("info", "datetime", "timestamp"))
+
+
+def _float_field(data: Dict[str, Any], *keys: str, default: float = 0.0) -> float:
+    """
+    Read the first set numeric field from a ccxt structure as a float.
+
+    ccxt fills unknown unified fields with None rather than leaving them
+    out, so those, and empty strings, fall through to the next key.
+
+    Args:
+        data: ccxt response structure
+        *keys: Field names to try, in order
+        default: Value when none of the fields is set
+
+    Returns:
+        float: The first set field, or default
+    """
+    for key in keys:
+        value = data.get(key)
+        if value is not None and value != "":
+            return float(value)
+    return default
+
 
 class CustomBitfinex(ccxt.bitfinex):
     """Custom Bitfinex class with enhanced thread-safe nonce handling."""
@@ -29,10 +55,9 @@ class CustomBitfinex(ccxt.bitfinex):
         Uses GlobalNonceManager to ensure no conflicts across all services.
         This ensures millisecond precision as required by Bitfinex API.
         """
-        global_nonce_manager = get_global_nonce_manager()
         api_key = getattr(self, "apiKey", "unknown")
 
-        return global_nonce_manager.get_next_nonce(
+        return self._global_nonce_manager.get_next_nonce(
             api_key=api_key, service_name="CustomBitfinex"
         )
 
@@ -374,6 +399,46 @@ class ExchangeService:
         except Exception as e:
             raise ExchangeError(f"Failed to fetch ticker: {str(e)}")
 
+    def fetch_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch current market data for several symbols in one request.
+
+        Uses ccxt's batch endpoint when the exchange supports it and falls
+        back to concurrent fetch_ticker calls, one per symbol, otherwise.
+
+        Args:
+            symbols: Trading pairs
+
+        Returns:
+            Dict mapping symbol to market data in the fetch_ticker format
+
+        Raises:
+            ExchangeError: If ticker fetch fails
+        """
+        if not symbols:
+            return {}
+
+        if not self.exchange.has.get("fetchTickers"):
+            # Requests are I/O bound, so fan them out over a few threads
+            with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as pool:
+                return dict(zip(symbols, pool.map(self.fetch_ticker, symbols)))
+
+        try:
+            tickers = self.exchange.fetch_tickers(symbols)
+            return {
+                symbol: {
+                    "symbol": symbol,
+                    "last": float(ticker["last"]),
+                    "bid": float(ticker["bid"]),
+                    "ask": float(ticker["ask"]),
+                    "volume": float(ticker["baseVolume"]),
+                    "timestamp": ticker["timestamp"],
+                }
+                for symbol, ticker in tickers.items()
+            }
+        except Exception as e:
+            raise ExchangeError(f"Failed to fetch tickers: {str(e)}")
+
     def fetch_balance(self) -> Dict[str, float]:
         """
         Fetch account balance with retry mechanism for nonce issues.
@@ -393,29 +458,29 @@ class ExchangeService:
                 result = {}
 
                 # Handle different balance structure formats
-                if "total" in balance and isinstance(balance["total"], dict):
+                totals = balance.get("total")
+                if isinstance(totals, dict):
                     # Standard CCXT format with nested structure
-                    for currency, amount in balance["total"].items():
-                        if isinstance(amount, dict) and "free" in amount:
-                            free_amount = float(amount["free"])
-                        else:
-                            free_amount = float(amount)
+                    for currency, amount in totals.items():
+                        if isinstance(amount, dict):
+                            amount = amount.get("free")
+                        free_amount = float(amount)
 
                         if free_amount > 0:
                             result[currency] = free_amount
                 else:
                     # Direct format or other structures
                     for currency, data in balance.items():
-                        if currency in ["info", "datetime", "timestamp"]:
+                        if currency in _BALANCE_METADATA_KEYS:
                             continue
 
                         if isinstance(data, dict):
-                            if "free" in data:
-                                free_amount = float(data["free"])
-                            elif "total" in data:
-                                free_amount = float(data["total"])
-                            else:
-                                free_amount = float(data.get("available", 0))
+                            amount = data.get("free")
+                            if amount is None:
+                                amount = data.get("total")
+                            if amount is None:
+                                amount = data.get("available", 0)
+                            free_amount = float(amount)
                         else:
                             free_amount = float(data)
 
@@ -561,6 +626,9 @@ class ExchangeService:
         try:
             positions = self.exchange.fetch_positions(symbols)
 
+            # Fallback timestamp for positions without one, read once per call
+            now_ms = int(time.time() * 1000)
+
             # Process all positions (including Bitfinex margin positions)
             active_positions = []
             for position in positions:
@@ -590,33 +658,28 @@ class ExchangeService:
 
                 # Only include positions with non-zero amounts
                 if actual_amount != 0:
-                    # Get mark price - try different sources
-                    mark_price = position.get("markPrice")
-                    if mark_price is None:
-                        mark_price = position.get("lastPrice", 0)
-
                     active_positions.append(
                         {
                             "id": position.get("id", ""),
                             "symbol": position["symbol"],
                             "side": position["side"],  # 'long' or 'short'
                             "amount": actual_amount,
-                            "entry_price": float(position.get("entryPrice", 0)),
-                            "mark_price": float(mark_price or 0),
-                            "pnl": float(position.get("unrealizedPnl", 0)),
-                            "pnl_percentage": float(position.get("percentage", 0)),
-                            "timestamp": position.get(
-                                "timestamp", int(datetime.utcnow().timestamp() * 1000)
+                            "entry_price": _float_field(position, "entryPrice"),
+                            "mark_price": _float_field(
+                                position, "markPrice", "lastPrice"
                             ),
-                            "contracts": float(position.get("contracts") or 0),
-                            "notional": float(position.get("notional") or 0),
-                            "collateral": float(position.get("collateral") or 0),
+                            "pnl": _float_field(position, "unrealizedPnl"),
+                            "pnl_percentage": _float_field(position, "percentage"),
+                            "timestamp": position.get("timestamp") or now_ms,
+                            "contracts": _float_field(position, "contracts"),
+                            "notional": _float_field(position, "notional"),
+                            "collateral": _float_field(position, "collateral"),
                             "margin_mode": position.get("marginMode", "isolated"),
-                            "maintenance_margin": float(
-                                position.get("maintenanceMargin") or 0
+                            "maintenance_margin": _float_field(
+                                position, "maintenanceMargin"
                             ),
                             "position_type": "margin",  # Mark as real margin position
-                            "leverage": float(position.get("leverage") or 1.0),
+                            "leverage": _float_field(position, "leverage") or 1.0,
                         }
                     )
 
@@ -746,10 +809,18 @@ class ExchangeService:
         """
         Fetch order history from exchange using supported methods.
 
+        On Bitfinex, orders for several symbols come from a single closed
+        orders request covering all pairs, capped at `limit` times the
+        number of symbols, and are then filtered and capped at `limit` per
+        symbol client-side. A busy symbol can therefore leave quieter ones
+        with fewer than `limit` orders, and the call is all-or-nothing: if
+        the request fails, no symbol's history is returned.
+
         Args:
             symbols: Optional list of symbols to filter by
             since: Optional timestamp (in milliseconds) to fetch orders from
-            limit: Maximum number of orders to return (default 100)
+            limit: Maximum number of orders to return (default 100), per
+                symbol when symbols are given
 
         Returns:
             List of order dictionaries
@@ -761,31 +832,18 @@ class ExchangeService:
             # Bitfinex doesn't support fetchOrders(), use fetchClosedOrders() instead
             if hasattr(self.exchange, "id") and self.exchange.id == "bitfinex":
                 # Use fetchClosedOrders() for Bitfinex (supported method)
-                all_orders = []
-
                 if symbols:
-                    # Fetch closed orders for each symbol
-                    for symbol in symbols:
-                        try:
-                            # Convert UI symbol to Bitfinex trading pair format
-                            bitfinex_symbol = (
-                                BitfinexSymbolConverter.convert_for_api_call(
-                                    symbol, "trading"
-                                )
-                            )
-                            # Lägg till market type för Bitfinex
-                            params = {"type": "exchange"}
-                            print(
-                                f"⚠️ [Exchange] Added market type 'exchange' for fetch_closed_orders: {bitfinex_symbol}"
-                            )
-                            orders = self.exchange.fetch_closed_orders(
-                                bitfinex_symbol, since, limit, params
-                            )
-                            all_orders.extend(orders)
-                        except Exception as e:
-                            # Log error but continue with other symbols
-                            print(f"Warning: Could not fetch orders for {symbol}: {e}")
-                            continue
+                    # The order history endpoint covers every pair, so fetch
+                    # it once for all requested symbols and split client-side
+                    # instead of sending one authenticated request per symbol
+                    wanted = {
+                        BitfinexSymbolConverter.convert_for_api_call(symbol, "trading")
+                        for symbol in symbols
+                    }
+                    orders = self.exchange.fetch_closed_orders(
+                        None, since, limit * len(wanted), {"type": "exchange"}
+                    )
+                    all_orders = self._latest_orders_per_symbol(orders, wanted, limit)
                 else:
                     # Fetch all closed orders
                     all_orders = self.exchange.fetch_closed_orders(None, since, limit)
@@ -832,6 +890,37 @@ class ExchangeService:
         except Exception as e:
             raise ExchangeError(f"Failed to fetch order history: {str(e)}")
 
+    @staticmethod
+    def _latest_orders_per_symbol(
+        orders: List[Dict[str, Any]], wanted: Set[str], limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Keep the newest `limit` orders for each wanted symbol.
+
+        Args:
+            orders: Orders from a request covering every pair
+            wanted: Requested symbols in Bitfinex trading pair format
+            limit: Maximum number of orders to keep per symbol
+
+        Returns:
+            The kept orders, newest first within each symbol
+        """
+        kept: Dict[str, List[Dict[str, Any]]] = {}
+        newest_first = sorted(
+            orders, key=lambda order: order.get("timestamp") or 0, reverse=True
+        )
+        for order in newest_first:
+            symbol = order.get("symbol")
+            if not symbol:
+                continue
+            pair = BitfinexSymbolConverter.convert_for_api_call(symbol, "trading")
+            if pair not in wanted:
+                continue
+            symbol_orders = kept.setdefault(pair, [])
+            if len(symbol_orders) < limit:
+                symbol_orders.append(order)
+        return [order for symbol_orders in kept.values() for order in symbol_orders]
+
     def fetch_open_orders(self, symbol: Optional[str] = None) -> list:
         """
         Fetch open orders from exchange.
@@ -6,9 +6,16 @@ This module provides asynchronous wrapper functions around the ExchangeService.
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import MagicMock
 
+try:
+    import httpx
+except ImportError:
+    httpx = None  # Handle missing httpx, tickers then always go through ccxt
+
 from backend.services.exchange import ExchangeError, ExchangeService
 
 logger = logging.getLogger(__name__)
@@ -16,6 +23,83 @@ logger = logging.getLogger(__name__)
 # Global exchange instance
 _exchange_instance = None
 
+# Recent tickers from fetch_tickers_async: symbol -> (monotonic time, ticker).
+# Shared across requests so overlapping symbol sets reuse the same prices.
+_ticker_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_TICKER_TTL_SECONDS = 2.0
+
+# Prices older than this are never served as a fallback; the call fails
+# instead of valuing positions at a price from minutes ago
+_TICKER_MAX_STALE_SECONDS = 60.0
+
+# Ticker requests slower than this are abandoned and the last known prices
+# served instead, so a stalled exchange cannot stall the positions endpoint
+_TICKER_TIMEOUT_SECONDS = 2.0
+
+
+class _CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Closed while calls succeed. After `threshold` failures in a row it
+    opens and refuses calls for `reset_seconds`, then lets a single probe
+    call through (half-open); the probe's outcome closes or reopens it. A
+    probe that never reports back is replaced after another `reset_seconds`.
+    """
+
+    def __init__(self, threshold: int, reset_seconds: float):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_started_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted now."""
+        if self.opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at < self.reset_seconds:
+            return False
+        if (
+            self.probe_started_at is not None
+            and now - self.probe_started_at < self.reset_seconds
+        ):
+            return False
+        self.probe_started_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self.failures = 0
+        self.opened_at = None
+        self.probe_started_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker at the threshold."""
+        self.failures += 1
+        self.probe_started_at = None
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+# Pauses ticker requests for 30 seconds after three failures in a row
+_ticker_breaker = _CircuitBreaker(threshold=3, reset_seconds=30.0)
+
+# Public Bitfinex REST API used for raw ticker requests. One HTTP/2 client
+# per event loop is shared so concurrent requests are multiplexed over a
+# single connection; its connections are bound to the loop that opened them.
+_BITFINEX_PUBLIC_URL = "https://api-pub.bitfinex.com"
+_http_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Static orderbook served by the mock exchange. The price levels are
+# immutable tuples; each call gets its own top-level dict so a caller that
+# edits the book cannot change it for everyone else.
+_MOCK_ORDER_BOOK: Dict[str, Any] = {
+    "bids": ((35000.0, 1.5), (34900.0, 2.3)),
+    "asks": ((35100.0, 1.2), (35200.0, 3.4)),
+}
+
 
 async def init_exchange_async() -> None:
     """
@@ -44,6 +128,21 @@ async def init_exchange_async() -> None:
         logger.warning("⚠️ Using mock exchange service as fallback")
 
 
+def get_exchange_instance() -> Optional[ExchangeService]:
+    """
+    Get the shared exchange service created by init_exchange_async.
+
+    Importing _exchange_instance directly binds the value at import time,
+    which is None until initialization has run. Call this instead so every
+    caller reuses the one client and its HTTP session.
+
+    Returns:
+        Optional[ExchangeService]: The shared exchange service, or None if
+        it has not been initialized
+    """
+    return _exchange_instance
+
+
 async def fetch_balance_async(exchange: ExchangeService) -> Dict[str, Any]:
     """
     Fetch account balance asynchronously.
@@ -142,6 +241,259 @@ async def fetch_ticker_async(exchange: ExchangeService, symbol: str) -> Dict[str
         raise ExchangeError(f"Failed to fetch ticker: {str(e)}")
 
 
+async def fetch_tickers_async(
+    exchange: ExchangeService, symbols: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch ticker data for several symbols asynchronously.
+
+    Tickers fetched in the last _TICKER_TTL_SECONDS are served from memory;
+    only the remaining symbols are requested. On Bitfinex, once ccxt has
+    loaded its markets, they come from one raw /v2/tickers request over a
+    shared HTTP/2 connection. Otherwise, or if that request fails, they go
+    through ccxt.
+
+    Requests are bounded by _TICKER_TIMEOUT_SECONDS and guarded by a circuit
+    breaker. When a request times out or fails, or the breaker is open, the
+    last known prices are returned for the symbols that have one no older
+    than _TICKER_MAX_STALE_SECONDS.
+
+    Args:
+        exchange: ExchangeService instance
+        symbols: Trading pair symbols
+
+    Returns:
+        Dict mapping symbol to ticker data
+
+    Raises:
+        ExchangeError: If the request fails and no recent enough prices
+            are known
+    """
+    tickers = {}
+    missing = []
+    now = time.monotonic()
+    for symbol in symbols:
+        cached = _ticker_cache.get(symbol)
+        if cached is not None and now - cached[0] < _TICKER_TTL_SECONDS:
+            tickers[symbol] = cached[1]
+        else:
+            missing.append(symbol)
+
+    if not missing:
+        return tickers
+
+    if not _ticker_breaker.allow():
+        return _with_last_known_tickers(
+            tickers, missing, "Ticker requests paused after repeated failures"
+        )
+
+    try:
+        fetched = await asyncio.wait_for(
+            _fetch_tickers_uncached(exchange, missing),
+            timeout=_TICKER_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        _ticker_breaker.record_failure()
+        return _with_last_known_tickers(tickers, missing, "Ticker request timed out")
+    except ExchangeError as e:
+        _ticker_breaker.record_failure()
+        return _with_last_known_tickers(tickers, missing, str(e))
+    _ticker_breaker.record_success()
+
+    fetched_at = time.monotonic()
+    for symbol, ticker in fetched.items():
+        _ticker_cache[symbol] = (fetched_at, ticker)
+    tickers.update(fetched)
+    return tickers
+
+
+def _with_last_known_tickers(
+    tickers: Dict[str, Dict[str, Any]], missing: List[str], reason: str
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fill in missing tickers with the last prices fetched, if recent enough.
+
+    Prices older than _TICKER_MAX_STALE_SECONDS are left out, so those
+    symbols stay missing from the result.
+
+    Args:
+        tickers: Tickers already resolved for this call, updated in place
+        missing: Symbols that could not be fetched
+        reason: Why they could not be fetched, logged or raised
+
+    Returns:
+        The updated tickers
+
+    Raises:
+        ExchangeError: If no recent enough price is known for any missing
+            symbol
+    """
+    now = time.monotonic()
+    stale = {}
+    for symbol in missing:
+        cached = _ticker_cache.get(symbol)
+        if cached is not None and now - cached[0] < _TICKER_MAX_STALE_SECONDS:
+            stale[symbol] = cached[1]
+    if not stale:
+        raise ExchangeError(reason)
+
+    logger.warning("Serving last known tickers for %s (%s)", ", ".join(stale), reason)
+    tickers.update(stale)
+    return tickers
+
+
+async def _fetch_tickers_uncached(
+    exchange: ExchangeService, symbols: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Request tickers from the exchange, raw from Bitfinex when possible.
+
+    Args:
+        exchange: ExchangeService instance
+        symbols: Trading pair symbols
+
+    Returns:
+        Dict mapping symbol to ticker data
+
+    Raises:
+        ExchangeError: If the ccxt batch request fails
+    """
+    market_ids = _bitfinex_market_ids(exchange, symbols)
+    if market_ids is not None:
+        try:
+            return await _fetch_tickers_raw(market_ids)
+        except (httpx.HTTPError, ValueError, TypeError, IndexError) as e:
+            logger.warning("Raw ticker request failed, using ccxt: %s", e)
+
+    return await _fetch_tickers_ccxt(exchange, symbols)
+
+
+def _bitfinex_market_ids(
+    exchange: ExchangeService, symbols: List[str]
+) -> Optional[Dict[str, str]]:
+    """
+    Map Bitfinex market ids to symbols for a raw ticker request.
+
+    Args:
+        exchange: ExchangeService instance
+        symbols: Trading pair symbols
+
+    Returns:
+        Dict mapping market id (e.g. "tBTCUSD") to symbol, or None when the
+        raw endpoint cannot be used: httpx is missing, the exchange is not
+        Bitfinex, or ccxt has not loaded a market for every symbol yet
+    """
+    client = exchange.exchange
+    if httpx is None or client.id != "bitfinex" or not client.markets:
+        return None
+
+    market_ids = {}
+    for symbol in symbols:
+        market = client.markets.get(symbol)
+        if market is None:
+            return None
+        market_ids[market["id"]] = symbol
+    return market_ids
+
+
+async def _fetch_tickers_raw(market_ids: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch tickers straight from Bitfinex's public /v2/tickers endpoint.
+
+    Skips ccxt's request signing and response unification, which the
+    positions hot path does not need for read-only prices.
+
+    Args:
+        market_ids: Dict mapping Bitfinex market id to symbol
+
+    Returns:
+        Dict mapping symbol to market data in the fetch_ticker format
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the response is not valid JSON
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None:
+        client = _http_clients[loop] = httpx.AsyncClient(
+            base_url=_BITFINEX_PUBLIC_URL, http2=True, timeout=5.0
+        )
+
+    response = await client.get("/v2/tickers", params={"symbols": ",".join(market_ids)})
+    response.raise_for_status()
+
+    timestamp = int(time.time() * 1000)
+    tickers = {}
+    # Rows are [SYMBOL, BID, BID_SIZE, ASK, ASK_SIZE, DAILY_CHANGE,
+    # DAILY_CHANGE_RELATIVE, LAST_PRICE, VOLUME, HIGH, LOW]
+    for row in response.json():
+        symbol = market_ids.get(row[0])
+        if symbol is None:
+            continue
+        tickers[symbol] = {
+            "symbol": symbol,
+            "last": float(row[7]),
+            "bid": float(row[1]),
+            "ask": float(row[3]),
+            "volume": float(row[8]),
+            "timestamp": timestamp,
+        }
+    return tickers
+
+
+async def close_http_client_async() -> None:
+    """Close the running loop's HTTP client used for raw ticker requests."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _fetch_tickers_ccxt(
+    exchange: ExchangeService, symbols: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch tickers through ccxt in the thread pool.
+
+    Uses one batch request when the exchange supports it. Otherwise the
+    per-symbol requests run concurrently, and symbols whose request fails
+    are left out of the result.
+
+    Args:
+        exchange: ExchangeService instance
+        symbols: Trading pair symbols
+
+    Returns:
+        Dict mapping symbol to ticker data
+
+    Raises:
+        ExchangeError: If the batch request fails
+    """
+    loop = asyncio.get_event_loop()
+    if exchange.exchange.has.get("fetchTickers"):
+        try:
+            return await loop.run_in_executor(
+                None, lambda: exchange.fetch_tickers(symbols)
+            )
+        except Exception as e:
+            raise ExchangeError(f"Failed to fetch tickers: {str(e)}")
+
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(None, exchange.fetch_ticker, symbol)
+            for symbol in symbols
+        ),
+        return_exceptions=True,
+    )
+    fetched = {}
+    for symbol, result in zip(symbols, results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to fetch ticker for %s: %s", symbol, result)
+        else:
+            fetched[symbol] = result
+    return fetched
+
+
 async def fetch_recent_trades_async(
     exchange: ExchangeService, symbol: str, limit: int = 50
 ) -> List[Dict[str, Any]]:
@@ -190,6 +542,28 @@ async def get_markets_async(exchange: ExchangeService) -> Dict[str, Any]:
         raise ExchangeError(f"Failed to fetch markets: {str(e)}")
 
 
+async def preload_markets_async(exchange: ExchangeService) -> None:
+    """
+    Warm the exchange client's market cache asynchronously.
+
+    ccxt loads markets lazily on the first order call; loading them up front
+    lets callers overlap that round-trip with local work. Failures are only
+    logged, since the order call itself will surface any real problem.
+
+    Args:
+        exchange: ExchangeService instance
+    """
+    client = getattr(exchange, "exchange", None)
+    if client is None or getattr(client, "markets", None):
+        return
+
+    try:
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, client.load_markets)
+    except Exception as e:
+        logger.debug(f"Market preload failed: {str(e)}")
+
+
 async def get_trading_limitations_async(exchange: ExchangeService) -> Dict[str, Any]:
     """
     Get trading limitations asynchronously.
@@ -375,10 +749,7 @@ def create_mock_exchange_service() -> MagicMock:
     mock.fetch_ohlcv.return_value = [
         [1625097600000, 35000.0, 35100.0, 34900.0, 35050.0, 10.5]
     ]
-    mock.fetch_order_book.return_value = {
-        "bids": [[35000.0, 1.5], [34900.0, 2.3]],
-        "asks": [[35100.0, 1.2], [35200.0, 3.4]],
-    }
+    mock.fetch_order_book.side_effect = lambda *args, **kwargs: dict(_MOCK_ORDER_BOOK)
     mock.fetch_ticker.return_value = {
         "symbol": "tBTCUSD",
         "bid": 35000.0,
@@ -386,6 +757,10 @@ def create_mock_exchange_service() -> MagicMock:
         "last": 35050.0,
         "volume": 1000.5,
     }
+    mock.fetch_tickers.side_effect = lambda symbols: {
+        symbol: {**mock.fetch_ticker.return_value, "symbol": symbol}
+        for symbol in symbols
+    }
     mock.fetch_recent_trades.return_value = [
         {"id": 1, "price": 35050.0, "amount": 0.1, "timestamp": 1625097600000}
     ]
@@ -13,6 +13,11 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 
+def _now_ms() -> int:
+    """Milliseconds since Unix epoch, read without a float round-trip."""
+    return time.time_ns() // 1_000_000
+
+
 @dataclass
 class NonceRequest:
     """Request för nonce från kö-systemet"""
@@ -65,13 +70,15 @@ class EnhancedGlobalNonceManager:
         )
 
         # Initialize enhanced nonce state
-        self._last_nonce = round(datetime.now().timestamp() * 1000)
+        self._last_nonce = _now_ms()
         # Reentrant lock för nested calls
         self._nonce_lock = threading.RLock()
 
         # SEKVENTIELL KÖ för race condition elimination
         self._request_queue: deque[NonceRequest] = deque()
         self._queue_lock = threading.Lock()
+        # Signalled when a request is queued so the processor can sleep
+        self._queue_ready = threading.Condition(self._queue_lock)
         self._queue_processor_running = False
         self._queue_processor_thread: Optional[threading.Thread] = None
 
@@ -116,7 +123,10 @@ class EnhancedGlobalNonceManager:
         """Sekventiell processor för nonce-requests"""
         while self._queue_processor_running:
             try:
-                with self._queue_lock:
+                with self._queue_ready:
+                    # Sleep until a request is queued instead of spinning
+                    while not self._request_queue and self._queue_processor_running:
+                        self._queue_ready.wait(timeout=0.5)
                     if not self._request_queue:
                         continue
 
@@ -180,7 +190,7 @@ class EnhancedGlobalNonceManager:
         """
         # Om i utvecklingsläge, returnera en enkel timestamp utan köhantering
         if self._development_mode:
-            return round(datetime.now().timestamp() * 1000)
+            return self._next_timestamp_nonce()
 
         request_time = time.time()
 
@@ -193,8 +203,9 @@ class EnhancedGlobalNonceManager:
         )
 
         # Add to sekventiell kö (FIFO garanterat)
-        with self._queue_lock:
+        with self._queue_ready:
             self._request_queue.append(nonce_request)
+            self._queue_ready.notify()
 
         # Wait för sekventiell processing (NO RACE CONDITIONS)
         nonce_request.future.wait(timeout=5.0)  # 5s timeout för safety
@@ -216,7 +227,7 @@ class EnhancedGlobalNonceManager:
         """
         # Om i utvecklingsläge, returnera en enkel timestamp utan någon loggning
         if self._development_mode:
-            return round(datetime.now().timestamp() * 1000)
+            return self._next_timestamp_nonce()
 
         with self._nonce_lock:
             # Rate limiting check
@@ -228,17 +239,7 @@ class EnhancedGlobalNonceManager:
                     time.sleep(needed_delay)
 
             # Use Bitfinex official method: milliseconds since Unix epoch
-            now_milliseconds = round(datetime.now().timestamp() * 1000)
-
-            # Ensure nonce always increments with minimum gap
-            if now_milliseconds <= self._last_nonce:
-                # If current time is not ahead, add minimum increment
-                self._last_nonce += 1
-            else:
-                # Use current time but ensure increment from last nonce
-                self._last_nonce = max(now_milliseconds, self._last_nonce + 1)
-
-            nonce = self._last_nonce
+            nonce = self._next_timestamp_nonce()
 
             # Update statistics
             self._last_request_time[api_key] = request_time
@@ -266,6 +267,17 @@ class EnhancedGlobalNonceManager:
 
             return nonce
 
+    def _next_timestamp_nonce(self) -> int:
+        """
+        Next millisecond timestamp nonce, strictly greater than the last one.
+
+        Returns:
+            Unique nonce (milliseconds since epoch)
+        """
+        with self._nonce_lock:
+            self._last_nonce = max(_now_ms(), self._last_nonce + 1)
+            return self._last_nonce
+
     def get_websocket_nonce(self, api_key: str) -> str:
         """
         Generate nonce för WebSocket authentication via sekventiell kö.
@@ -278,7 +290,7 @@ class EnhancedGlobalNonceManager:
         """
         # Om i utvecklingsläge, returnera en enkel timestamp utan köhantering
         if self._development_mode:
-            ws_nonce = round(datetime.now().timestamp() * 1000) * 1000
+            ws_nonce = _now_ms() * 1000
             return str(ws_nonce)
 
         # Use sekventiell kö även för WebSocket
@@ -341,7 +353,9 @@ class EnhancedGlobalNonceManager:
             print("⚠️ GlobalNonceManager redan inaktiverad (utvecklingsläge)")
             return
 
-        self._queue_processor_running = False
+        with self._queue_ready:
+            self._queue_processor_running = False
+            self._queue_ready.notify_all()
         if self._queue_processor_thread and self._queue_processor_thread.is_alive():
             self._queue_processor_thread.join(timeout=2.0)
         print("🔐 Enhanced GlobalNonceManager shutdown complete")
@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
-from backend.services.exchange_async import _exchange_instance
+from backend.services.exchange_async import get_exchange_instance
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +74,7 @@ class LivePortfolioServiceAsync:
 
     def __init__(self):
         """Initialize the live portfolio service."""
-        self.exchange = _exchange_instance
+        self.exchange = get_exchange_instance()
         logger.info("LivePortfolioServiceAsync initialized")
 
     async def get_live_portfolio_snapshot(
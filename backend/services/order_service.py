@@ -1,5 +1,7 @@
 """Order management service."""
 
+import os
+import time
 import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -7,19 +9,51 @@ from typing import Any, Dict, List, Optional
 from backend.services.exchange import ExchangeService
 from backend.services.validation import validate_order_data, validate_trading_pair
 
+# Order statuses that can still change on the exchange side
+ORDER_REFETCH_STATUSES = frozenset({"open", "pending"})
+
+
+def generate_order_id() -> str:
+    """
+    Generate a time-ordered order ID (UUID version 7).
+
+    IDs sort by creation time, which keeps insertion order and index
+    locality when orders are stored in ordered maps or the database.
+    Uses uuid.uuid7 where the standard library provides it (Python 3.14+).
+
+    Returns:
+        str: Canonical UUID string
+    """
+    if hasattr(uuid, "uuid7"):
+        return str(uuid.uuid7())
+
+    timestamp_ms = time.time_ns() // 1_000_000
+    random_bits = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | ((random_bits >> 62) & 0xFFF) << 64
+        | 0b10 << 62
+        | (random_bits & 0x3FFFFFFFFFFFFFFF)
+    )
+    return str(uuid.UUID(int=value))
+
 
 class OrderService:
     """Service for managing trading orders."""
 
-    def __init__(self, exchange_service: ExchangeService):
+    def __init__(self, exchange_service: ExchangeService, poll_ttl: float = 1.0):
         """
         Initialize order service.
 
         Args:
             exchange_service: Exchange service for executing orders
+            poll_ttl: Minimum seconds between exchange refreshes of one order
         """
         self.exchange = exchange_service
         self.orders: Dict[str, Dict[str, Any]] = {}
+        self.poll_ttl = poll_ttl
+        self._last_fetched_at: Dict[str, float] = {}
 
     def place_order(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -45,17 +79,24 @@ class OrderService:
         if not is_valid:
             raise ValueError(error)
 
+        # Read each order field once and reuse it below
+        symbol = data["symbol"]
+        order_type = data["order_type"]
+        side = data["side"]
+        amount = float(data["amount"])
+        price = float(data.get("price", 0))
+
         # Generate order ID
-        order_id = str(uuid.uuid4())
+        order_id = generate_order_id()
 
         # Create order record
         order = {
             "id": order_id,
-            "symbol": data["symbol"],
-            "type": data["order_type"],
-            "side": data["side"],
-            "amount": float(data["amount"]),
-            "price": float(data.get("price", 0)),
+            "symbol": symbol,
+            "type": order_type,
+            "side": side,
+            "amount": amount,
+            "price": price,
             "status": "pending",
             "created_at": datetime.utcnow().isoformat(),
             "leverage": float(data.get("leverage", 1.0)),
@@ -66,11 +107,11 @@ class OrderService:
         try:
             # Execute order on exchange
             exchange_order = self.exchange.create_order(
-                symbol=data["symbol"],
-                order_type=data["order_type"],
-                side=data["side"],
-                amount=float(data["amount"]),
-                price=float(data.get("price", 0)),
+                symbol=symbol,
+                order_type=order_type,
+                side=side,
+                amount=amount,
+                price=price,
             )
 
             # Update order with exchange details
@@ -79,7 +120,7 @@ class OrderService:
                     "status": "open",
                     "exchange_order_id": exchange_order["id"],
                     "filled_amount": 0.0,
-                    "remaining_amount": float(data["amount"]),
+                    "remaining_amount": amount,
                 }
             )
 
@@ -101,6 +142,9 @@ class OrderService:
         Args:
             order_id: Order identifier
 
+        Live orders are refreshed from the exchange at most once per
+        poll_ttl, so their status can be up to poll_ttl seconds old.
+
         Returns:
             Order details or None if not found
         """
@@ -108,7 +152,15 @@ class OrderService:
             return None
 
         order = self.orders[order_id]
-        if order["status"] == "open":
+        now = time.monotonic()
+        # Terminal orders (filled, closed, cancelled, failed) never change again,
+        # and live ones are only refreshed once per poll_ttl
+        if (
+            order["status"] in ORDER_REFETCH_STATUSES
+            and "exchange_order_id" in order
+            and now - self._last_fetched_at.get(order_id, float("-inf")) > self.poll_ttl
+        ):
+            self._last_fetched_at[order_id] = now
             try:
                 # Update order status from exchange
                 exchange_order = self.exchange.fetch_order(
@@ -122,6 +174,9 @@ class OrderService:
                         "remaining_amount": exchange_order["remaining"],
                     }
                 )
+                if order["status"] not in ORDER_REFETCH_STATUSES:
+                    # Terminal orders are never refetched again
+                    self._last_fetched_at.pop(order_id, None)
 
             except Exception as e:
                 order["error"] = str(e)
@@ -151,6 +206,7 @@ class OrderService:
 
             order["status"] = "cancelled"
             order["cancelled_at"] = datetime.utcnow().isoformat()
+            self._last_fetched_at.pop(order_id, None)
             return True
 
         except Exception as e:
@@ -1,6 +1,7 @@
 """Order management service - async version."""
 
-import uuid
+import asyncio
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -10,22 +11,34 @@ from backend.services.exchange_async import (
     create_order_async,
     fetch_open_orders_async,
     fetch_order_async,
+    preload_markets_async,
 )
+from backend.services.order_service import ORDER_REFETCH_STATUSES, generate_order_id
 from backend.services.validation import validate_order_data, validate_trading_pair
 
 
 class OrderServiceAsync:
     """Async service for managing trading orders."""
 
-    def __init__(self, exchange_service: ExchangeService):
+    def __init__(
+        self,
+        exchange_service: ExchangeService,
+        poll_ttl: float = 1.0,
+        cancel_concurrency: int = 16,
+    ):
         """
         Initialize order service.
 
         Args:
             exchange_service: Exchange service for executing orders
+            poll_ttl: Minimum seconds between exchange refreshes of one order
+            cancel_concurrency: Maximum parallel exchange calls in cancel_orders
         """
         self.exchange = exchange_service
         self.orders: Dict[str, Dict[str, Any]] = {}
+        self.poll_ttl = poll_ttl
+        self.cancel_concurrency = cancel_concurrency
+        self._last_fetched_at: Dict[str, float] = {}
 
     async def place_order(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -41,29 +54,36 @@ class OrderServiceAsync:
             ValueError: If order data is invalid
             ExchangeError: If order placement fails
         """
-        # Validate order data
-        validation_result = validate_order_data(data)
-        if not validation_result["valid"]:
-            raise ValueError(f"Invalid order data: {validation_result['errors']}")
+        # Warm the exchange market cache while the order is validated in the
+        # thread pool, so the two actually run at the same time
+        loop = asyncio.get_running_loop()
+        preflight = asyncio.ensure_future(preload_markets_async(self.exchange))
+        try:
+            await asyncio.gather(
+                preflight, loop.run_in_executor(None, self._validate_order, data)
+            )
+        finally:
+            # No-op once the preload finished; stops it if validation failed
+            preflight.cancel()
 
-        # Validate trading pair
-        is_valid, error = validate_trading_pair(data["symbol"])
-        if not is_valid:
-            raise ValueError(error)
+        # Read each order field once and reuse it below
+        symbol = data["symbol"]
+        order_type = data["order_type"]
+        side = data["side"]
+        amount = float(data["amount"])
+        price = data.get("price")  # Can be None for market orders
 
         # Generate order ID
-        order_id = str(uuid.uuid4())
+        order_id = generate_order_id()
 
         # Create order record
         order = {
             "id": order_id,
-            "symbol": data["symbol"],
-            "type": data["order_type"],
-            "side": data["side"],
-            "amount": float(data["amount"]),
-            "price": (
-                float(data.get("price", 0)) if data.get("price") is not None else None
-            ),
+            "symbol": symbol,
+            "type": order_type,
+            "side": side,
+            "amount": amount,
+            "price": float(price) if price is not None else None,
             "status": "pending",
             "created_at": datetime.utcnow().isoformat(),
             "leverage": float(data.get("leverage", 1.0)),
@@ -75,13 +95,11 @@ class OrderServiceAsync:
             # Execute order on exchange using async method
             exchange_order = await create_order_async(
                 exchange=self.exchange,
-                symbol=data["symbol"],
-                order_type=data["order_type"],
-                side=data["side"],
-                amount=float(data["amount"]),
-                price=data.get(
-                    "price"
-                ),  # Pass price as-is (can be None for market orders)
+                symbol=symbol,
+                order_type=order_type,
+                side=side,
+                amount=amount,
+                price=price,  # Pass price as-is (can be None for market orders)
             )
 
             # Update order with exchange details
@@ -90,7 +108,7 @@ class OrderServiceAsync:
                     "status": "open",
                     "exchange_order_id": exchange_order["id"],
                     "filled_amount": 0.0,
-                    "remaining_amount": float(data["amount"]),
+                    "remaining_amount": amount,
                 }
             )
 
@@ -105,6 +123,25 @@ class OrderServiceAsync:
             self.orders[order_id] = order
             raise
 
+    @staticmethod
+    def _validate_order(data: Dict[str, Any]) -> None:
+        """
+        Validate order data and its trading pair.
+
+        Args:
+            data: Order data dictionary
+
+        Raises:
+            ValueError: If order data is invalid
+        """
+        validation_result = validate_order_data(data)
+        if not validation_result["valid"]:
+            raise ValueError(f"Invalid order data: {validation_result['errors']}")
+
+        is_valid, error = validate_trading_pair(data["symbol"])
+        if not is_valid:
+            raise ValueError(error)
+
     async def get_order_status(self, order_id: str) -> Optional[Dict[str, Any]]:
         """
         Get order status by ID asynchronously.
@@ -112,6 +149,9 @@ class OrderServiceAsync:
         Args:
             order_id: Order identifier
 
+        Live orders are refreshed from the exchange at most once per
+        poll_ttl, so their status can be up to poll_ttl seconds old.
+
         Returns:
             Order details or None if not found
         """
@@ -119,7 +159,15 @@ class OrderServiceAsync:
             return None
 
         order = self.orders[order_id]
-        if order["status"] == "open":
+        now = time.monotonic()
+        # Terminal orders (filled, closed, cancelled, failed) never change again,
+        # and live ones are only refreshed once per poll_ttl
+        if (
+            order["status"] in ORDER_REFETCH_STATUSES
+            and "exchange_order_id" in order
+            and now - self._last_fetched_at.get(order_id, float("-inf")) > self.poll_ttl
+        ):
+            self._last_fetched_at[order_id] = now
             try:
                 # Update order status from exchange using async method
                 exchange_order = await fetch_order_async(
@@ -135,6 +183,9 @@ class OrderServiceAsync:
                         "remaining_amount": exchange_order["remaining"],
                     }
                 )
+                if order["status"] not in ORDER_REFETCH_STATUSES:
+                    # Terminal orders are never refetched again
+                    self._last_fetched_at.pop(order_id, None)
 
             except Exception as e:
                 order["error"] = str(e)
@@ -168,12 +219,37 @@ class OrderServiceAsync:
 
             order["status"] = "cancelled"
             order["cancelled_at"] = datetime.utcnow().isoformat()
+            self._last_fetched_at.pop(order_id, None)
             return True
 
         except Exception as e:
             order["error"] = str(e)
             return False
 
+    async def cancel_orders(self, order_ids: List[str]) -> Dict[str, bool]:
+        """
+        Cancel several orders concurrently.
+
+        At most cancel_concurrency exchange calls run at once so bulk
+        cancels stay within the exchange rate limits.
+
+        Args:
+            order_ids: Order identifiers
+
+        Returns:
+            Dict mapping each order ID to whether it was cancelled
+        """
+        semaphore = asyncio.Semaphore(self.cancel_concurrency)
+
+        async def _cancel_one(order_id: str) -> bool:
+            async with semaphore:
+                return await self.cancel_order(order_id)
+
+        results = await asyncio.gather(
+            *(_cancel_one(order_id) for order_id in order_ids)
+        )
+        return dict(zip(order_ids, results))
+
     async def get_open_orders(
         self, symbol: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -191,45 +267,7 @@ class OrderServiceAsync:
             exchange_orders = await fetch_open_orders_async(
                 exchange=self.exchange, symbol=symbol
             )
-
-            # Update local order cache with exchange data
-            for exchange_order in exchange_orders:
-                order_id = None
-                # Find matching order in local cache by exchange_order_id
-                for local_id, local_order in self.orders.items():
-                    if local_order.get("exchange_order_id") == exchange_order["id"]:
-                        order_id = local_id
-                        break
-
-                if order_id:
-                    # Update existing order
-                    self.orders[order_id].update(
-                        {
-                            "status": exchange_order["status"],
-                            "filled_amount": exchange_order["filled"],
-                            "remaining_amount": exchange_order["remaining"],
-                        }
-                    )
-                else:
-                    # Create new order entry if not in local cache
-                    new_id = str(uuid.uuid4())
-                    self.orders[new_id] = {
-                        "id": new_id,
-                        "exchange_order_id": exchange_order["id"],
-                        "symbol": exchange_order["symbol"],
-                        "type": exchange_order["type"],
-                        "side": exchange_order["side"],
-                        "amount": float(exchange_order["amount"]),
-                        "price": (
-                            float(exchange_order.get("price", 0))
-                            if exchange_order.get("price") is not None
-                            else None
-                        ),
-                        "status": exchange_order["status"],
-                        "filled_amount": float(exchange_order.get("filled", 0)),
-                        "remaining_amount": float(exchange_order.get("remaining", 0)),
-                        "created_at": datetime.utcnow().isoformat(),
-                    }
+            self._merge_exchange_orders(exchange_orders)
         except Exception as e:
             # If exchange call fails, just use local cache
             pass
@@ -244,6 +282,91 @@ class OrderServiceAsync:
 
         return open_orders
 
+    async def get_open_orders_multi(
+        self, symbols: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get open orders for several trading pairs in one concurrent wave.
+
+        Args:
+            symbols: Trading pairs to fetch open orders for
+
+        Returns:
+            Dict mapping each symbol to its list of open orders
+        """
+        results = await asyncio.gather(
+            *(
+                fetch_open_orders_async(exchange=self.exchange, symbol=symbol)
+                for symbol in symbols
+            ),
+            return_exceptions=True,
+        )
+
+        # Merge every successful exchange response into the local cache at once;
+        # symbols whose fetch failed fall back to the local cache
+        for result in results:
+            if not isinstance(result, BaseException):
+                self._merge_exchange_orders(result)
+
+        orders_by_symbol: Dict[str, List[Dict[str, Any]]] = {
+            symbol: [] for symbol in symbols
+        }
+        for order in self.orders.values():
+            if order["status"] == "open" and order["symbol"] in orders_by_symbol:
+                orders_by_symbol[order["symbol"]].append(order)
+
+        return orders_by_symbol
+
+    def _merge_exchange_orders(self, exchange_orders: List[Dict[str, Any]]) -> None:
+        """
+        Update the local order cache with orders reported by the exchange.
+
+        Args:
+            exchange_orders: Orders as returned by the exchange
+        """
+        # Index local orders by exchange order id once instead of scanning
+        # the whole cache for every exchange order
+        local_ids = {
+            local_order.get("exchange_order_id"): local_id
+            for local_id, local_order in self.orders.items()
+        }
+
+        for exchange_order in exchange_orders:
+            order_id = local_ids.get(exchange_order["id"])
+
+            if order_id:
+                # Update existing order
+                self.orders[order_id].update(
+                    {
+                        "status": exchange_order["status"],
+                        "filled_amount": exchange_order["filled"],
+                        "remaining_amount": exchange_order["remaining"],
+                    }
+                )
+                if exchange_order["status"] not in ORDER_REFETCH_STATUSES:
+                    self._last_fetched_at.pop(order_id, None)
+            else:
+                # Create new order entry if not in local cache
+                new_id = generate_order_id()
+                self.orders[new_id] = {
+                    "id": new_id,
+                    "exchange_order_id": exchange_order["id"],
+                    "symbol": exchange_order["symbol"],
+                    "type": exchange_order["type"],
+                    "side": exchange_order["side"],
+                    "amount": float(exchange_order["amount"]),
+                    "price": (
+                        float(exchange_order.get("price", 0))
+                        if exchange_order.get("price") is not None
+                        else None
+                    ),
+                    "status": exchange_order["status"],
+                    "filled_amount": float(exchange_order.get("filled", 0)),
+                    "remaining_amount": float(exchange_order.get("remaining", 0)),
+                    "created_at": datetime.utcnow().isoformat(),
+                }
+                local_ids[exchange_order["id"]] = new_id
+
 
 # Singleton instance
 _order_service_async: Optional[OrderServiceAsync] = None
@@ -0,0 +1,170 @@
+"""
+Signal combination logic shared by the sync and async portfolio managers.
+
+Everything here is CPU-only, so both managers call it directly and only
+wrap the result in their own CombinedSignal/ProbabilityData types.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Container, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from backend.services.portfolio_kernels import combine_weighted
+from backend.strategies.sample_strategy import TradeSignal
+
+logger = logging.getLogger(__name__)
+
+# Order matches the [buy, sell, hold] columns of the combined probability vector
+ACTIONS = ("buy", "sell", "hold")
+
+# Buy, sell and hold probabilities assumed for signals without metadata
+DEFAULT_PROBABILITIES = (0.33, 0.33, 0.34)
+
+# Metadata keys that are the same for every combined signal
+COMBINE_METADATA = MappingProxyType({"combination_method": "weighted_average"})
+
+# Per-thread scratch arrays reused by combine_signals_core between calls
+_scratch = threading.local()
+
+
+def _scratch_buffers(size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return this thread's weight and row buffers with room for size rows."""
+    weights = getattr(_scratch, "weights", None)
+    if weights is None or weights.shape[0] < size:
+        capacity = max(size, 8)
+        weights = _scratch.weights = np.empty(capacity, dtype=np.float64)
+        _scratch.rows = np.empty((capacity, 4), dtype=np.float64)
+    return weights, _scratch.rows
+
+
+@dataclass(slots=True)
+class SignalCombination:
+    """Weighted combination of the strategy signals that passed filtering."""
+
+    action: str
+    probabilities: Tuple[float, float, float]  # buy, sell, hold
+    confidence: float
+    total_weight: float
+    strategy_names: List[str]
+    signals: List[TradeSignal]
+
+
+def combine_signals_core(
+    enabled_strategies: Mapping[str, Tuple[float, float]],
+    known_strategies: Container[str],
+    strategy_signals: Dict[str, TradeSignal],
+) -> Optional[SignalCombination]:
+    """
+    Filter strategy signals and compute their weighted combination.
+
+    Args:
+        enabled_strategies: Dict of strategy_name -> (weight, min_confidence)
+            for enabled strategies only
+        known_strategies: All configured strategy names, enabled or not
+        strategy_signals: Dict of strategy_name -> TradeSignal
+
+    Returns:
+        SignalCombination, or None if no signal carries positive weight
+    """
+    names: List[str] = []
+    signals: List[TradeSignal] = []
+
+    # Filled in place for accepted signals; only the first `count` rows are used
+    weights, rows = _scratch_buffers(len(strategy_signals))
+    count = 0
+
+    for strategy_name, signal in strategy_signals.items():
+        confidence = signal.confidence
+        metadata = signal.metadata
+
+        params = enabled_strategies.get(strategy_name)
+        if params is None:
+            if strategy_name not in known_strategies and logger.isEnabledFor(
+                logging.WARNING
+            ):
+                logger.warning("Unknown strategy: %s", strategy_name)
+            continue
+
+        weight, min_confidence = params
+        if confidence < min_confidence:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Signal from %s below minimum confidence", strategy_name)
+            continue
+
+        # Extract probabilities from signal metadata
+        row = rows[count]
+        if metadata:
+            row[0] = metadata.get("probability_buy", 0.33)
+            row[1] = metadata.get("probability_sell", 0.33)
+            row[2] = metadata.get("probability_hold", 0.34)
+        else:
+            row[:3] = DEFAULT_PROBABILITIES
+        row[3] = confidence
+        weights[count] = weight
+        count += 1
+
+        names.append(strategy_name)
+        signals.append(signal)
+
+    if count == 0:
+        return None
+
+    # Weighted average of [buy, sell, hold, confidence] and the winning action
+    combined, action_index, total_weight = combine_weighted(
+        weights[:count], rows[:count]
+    )
+
+    # Only reachable when every accepted strategy has zero weight
+    if total_weight <= 0:
+        return None
+
+    buy_prob, sell_prob, hold_prob, combined_confidence = combined.tolist()
+    return SignalCombination(
+        action=ACTIONS[action_index],
+        probabilities=(buy_prob, sell_prob, hold_prob),
+        confidence=combined_confidence,
+        total_weight=float(total_weight),
+        strategy_names=names,
+        signals=signals,
+    )
+
+
+def now_iso() -> str:
+    """
+    Current local time as an ISO-8601 string for portfolio metadata.
+
+    Millisecond precision is enough for signal and decision timestamps and
+    is cheaper to format than the default microseconds.
+
+    Returns:
+        str: Timestamp such as 2024-01-01T12:00:00.123
+    """
+    return datetime.now().isoformat(timespec="milliseconds")
+
+
+@lru_cache(maxsize=64)
+def diversification_factor(position_count: int, max_positions: int) -> float:
+    """
+    Scale factor for position size based on how many positions are open.
+
+    Results are memoized since both inputs are small integers that repeat
+    across every symbol in a batch.
+
+    Args:
+        position_count: Number of currently open positions
+        max_positions: Maximum number of open positions allowed
+
+    Returns:
+        float: Factor between 0.5 and 1.0
+    """
+    if not position_count:
+        return 1.0
+
+    # Simple diversification: more positions = lower individual position size
+    return max(0.5, 1.0 - (position_count / max_positions) * 0.5)
@@ -0,0 +1,64 @@
+"""
+Numeric kernels shared by the portfolio managers.
+
+The kernels are compiled with numba when it is installed. Without numba
+an equivalent NumPy implementation is used, so results are identical
+either way.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # Handle missing numba, fall back to NumPy
+
+
+def _combine_weighted_loop(
+    weights: np.ndarray, probs: np.ndarray
+) -> Tuple[np.ndarray, int, float]:
+    """Loop form of combine_weighted, written for numba compilation."""
+    total_weight = 0.0
+    acc = np.zeros(4)
+    for i in range(weights.shape[0]):
+        weight = weights[i]
+        total_weight += weight
+        for j in range(4):
+            acc[j] += probs[i, j] * weight
+
+    inv = 1.0 / total_weight if total_weight > 0 else 0.0
+    for j in range(4):
+        acc[j] *= inv
+
+    action_index = 0
+    if acc[1] > acc[0]:
+        action_index = 1
+    if acc[2] > acc[action_index]:
+        action_index = 2
+    return acc, action_index, total_weight
+
+
+def _combine_weighted_numpy(
+    weights: np.ndarray, probs: np.ndarray
+) -> Tuple[np.ndarray, int, float]:
+    """NumPy form of combine_weighted, used when numba is unavailable."""
+    total_weight = float(weights.sum())
+    inv = 1.0 / total_weight if total_weight > 0 else 0.0
+    acc = (weights @ probs) * inv
+
+    # argmax returns the first maximum, matching the loop form on ties
+    return acc, int(acc[:3].argmax()), total_weight
+
+
+# combine_weighted(weights, probs) -> (combined row, action index, total weight)
+#   weights: strategy weights, shape (N,)
+#   probs: per-strategy [buy, sell, hold, confidence] rows, shape (N, 4)
+# The action index follows buy, sell, hold order; the first wins on ties.
+if njit is not None:
+    combine_weighted = njit(cache=True, fastmath=True)(_combine_weighted_loop)
+    # Compile once at import instead of on the first trading tick
+    combine_weighted(np.ones(1), np.full((1, 4), 0.25))
+else:
+    combine_weighted = _combine_weighted_numpy
@@ -1,15 +1,29 @@
 """Portfolio management service for combining multiple strategy signals."""
 
+import itertools
 import logging
+import threading
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
+from backend.services.portfolio_core import (
+    COMBINE_METADATA,
+    combine_signals_core,
+    diversification_factor,
+    now_iso,
+)
 from backend.services.risk_manager import ProbabilityData, RiskManager
 from backend.strategies.sample_strategy import TradeSignal
 
+# Changes whenever any StrategyWeight field is assigned, so managers can tell
+# that a setting changed, even one edited directly by a caller, in O(1)
+_version_counter = itertools.count()
+_weights_version = next(_version_counter)
+
 
-@dataclass
+@dataclass(slots=True)
 class StrategyWeight:
     """Weight configuration for a strategy."""
 
@@ -18,8 +32,14 @@ class StrategyWeight:
     min_confidence: float = 0.5
     enabled: bool = True
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        global _weights_version
+
+        object.__setattr__(self, name, value)
+        _weights_version = next(_version_counter)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CombinedSignal:
     """Combined signal from multiple strategies."""
 
@@ -45,18 +65,48 @@ class PortfolioManager:
         """
         self.risk_manager = risk_manager
         self.strategy_weights = {sw.strategy_name: sw for sw in strategy_weights}
+        self._cached_key: Optional[Tuple[int, int, int]] = None
+        # Serializes cache rebuilds when the manager is shared between threads
+        self._cache_lock = threading.Lock()
         self._validate_weights()
 
+    def _settings_key(self) -> Tuple[int, int, int]:
+        """Key that changes when any strategy setting or the strategy set does."""
+        return (_weights_version, id(self.strategy_weights), len(self.strategy_weights))
+
+    def _refresh_enabled_cache(self) -> None:
+        """
+        Rebuild the cached view of enabled strategies after weight changes.
+
+        Changes are detected through the StrategyWeight version counter, so
+        objects edited directly by callers are picked up too.
+        """
+        with self._cache_lock:
+            key = self._settings_key()
+            if key == self._cached_key:
+                return
+
+            enabled = [sw for sw in self.strategy_weights.values() if sw.enabled]
+            self._enabled_names = [sw.strategy_name for sw in enabled]
+            self._enabled_weights_np = np.array(
+                [sw.weight for sw in enabled], dtype=np.float64
+            )
+            # name -> (weight, min_confidence) read by the signal combination loop
+            self._enabled_lookup = {
+                sw.strategy_name: (sw.weight, sw.min_confidence) for sw in enabled
+            }
+            self._sum_enabled_weight = float(self._enabled_weights_np.sum())
+            self._strategy_info_cache: Optional[Dict[str, Dict[str, Any]]] = None
+            self._cached_key = key
+
     def _validate_weights(self):
         """Validate that strategy weights sum to reasonable values."""
-        enabled_weights = [
-            sw.weight for sw in self.strategy_weights.values() if sw.enabled
-        ]
-        total_weight = sum(enabled_weights)
+        self._refresh_enabled_cache()
+        total_weight = self._sum_enabled_weight
 
         if total_weight > 1.1 or total_weight < 0.9:
             logging.warning(
-                f"Strategy weights sum to {total_weight:.2f}, consider normalizing"
+                "Strategy weights sum to %.2f, consider normalizing", total_weight
             )
 
     def combine_strategy_signals(
@@ -64,6 +114,7 @@ class PortfolioManager:
         strategy_signals: Dict[str, TradeSignal],
         symbol: str,
         current_price: float,
+        timestamp: Optional[str] = None,
     ) -> CombinedSignal:
         """
         Combine signals from multiple strategies into a single decision.
@@ -72,97 +123,49 @@ class PortfolioManager:
             strategy_signals: Dict of strategy_name -> TradeSignal
             symbol: Trading symbol
             current_price: Current price for the symbol
+            timestamp: Metadata timestamp shared by a batch, defaults to now
 
         Returns:
             CombinedSignal with combined probabilities and action
         """
+        timestamp = timestamp or now_iso()
+
         if not strategy_signals:
-            return self._create_hold_signal("No strategy signals provided")
-
-        # Filter valid signals and apply weights
-        valid_signals = {}
-        weighted_buy_prob = 0.0
-        weighted_sell_prob = 0.0
-        weighted_hold_prob = 0.0
-        weighted_confidence = 0.0
-        total_weight = 0.0
-
-        for strategy_name, signal in strategy_signals.items():
-            if strategy_name not in self.strategy_weights:
-                logging.warning(f"Unknown strategy: {strategy_name}")
-                continue
-
-            weight_config = self.strategy_weights[strategy_name]
-
-            if not weight_config.enabled:
-                continue
-
-            if signal.confidence < weight_config.min_confidence:
-                logging.info(f"Signal from {strategy_name} below minimum confidence")
-                continue
-
-            # Extract probabilities from signal metadata
-            metadata = signal.metadata or {}
-            prob_buy = metadata.get("probability_buy", 0.33)
-            prob_sell = metadata.get("probability_sell", 0.33)
-            prob_hold = metadata.get("probability_hold", 0.34)
-
-            # Apply strategy weight
-            weight = weight_config.weight
-            weighted_buy_prob += prob_buy * weight
-            weighted_sell_prob += prob_sell * weight
-            weighted_hold_prob += prob_hold * weight
-            weighted_confidence += signal.confidence * weight
-            total_weight += weight
-
-            valid_signals[strategy_name] = signal
-
-        if total_weight == 0:
-            return self._create_hold_signal("No valid signals after filtering")
-
-        # Normalize probabilities
-        if total_weight > 0:
-            combined_buy_prob = weighted_buy_prob / total_weight
-            combined_sell_prob = weighted_sell_prob / total_weight
-            combined_hold_prob = weighted_hold_prob / total_weight
-            combined_confidence = weighted_confidence / total_weight
-        else:
-            combined_buy_prob = combined_sell_prob = 0.33
-            combined_hold_prob = 0.34
-            combined_confidence = 0.0
-
-        # Determine final action
-        probabilities = [
-            ("buy", combined_buy_prob),
-            ("sell", combined_sell_prob),
-            ("hold", combined_hold_prob),
-        ]
-
-        # Choose action with highest probability
-        final_action = max(probabilities, key=lambda x: x[1])[0]
-
-        # Create combined probability data
+            return self._create_hold_signal("No strategy signals provided", timestamp)
+
+        self._refresh_enabled_cache()
+        combination = combine_signals_core(
+            self._enabled_lookup, self.strategy_weights, strategy_signals
+        )
+        if combination is None:
+            return self._create_hold_signal(
+                "No valid signals after filtering", timestamp
+            )
+
+        buy_prob, sell_prob, hold_prob = combination.probabilities
         combined_prob_data = ProbabilityData(
-            probability_buy=combined_buy_prob,
-            probability_sell=combined_sell_prob,
-            probability_hold=combined_hold_prob,
-            confidence=combined_confidence,
+            probability_buy=buy_prob,
+            probability_sell=sell_prob,
+            probability_hold=hold_prob,
+            confidence=combination.confidence,
         )
 
         metadata = {
+            **COMBINE_METADATA,
             "symbol": symbol,
             "current_price": current_price,
-            "strategies_used": list(valid_signals.keys()),
-            "total_weight": total_weight,
-            "combination_method": "weighted_average",
-            "timestamp": datetime.now().isoformat(),
+            "strategies_used": combination.strategy_names,
+            "total_weight": combination.total_weight,
+            "timestamp": timestamp,
         }
 
         return CombinedSignal(
-            action=final_action,
-            combined_confidence=combined_confidence,
+            action=combination.action,
+            combined_confidence=combination.confidence,
             combined_probabilities=combined_prob_data,
-            individual_signals=valid_signals,
+            individual_signals=dict(
+                zip(combination.strategy_names, combination.signals)
+            ),
             metadata=metadata,
         )
 
@@ -211,15 +214,9 @@ class PortfolioManager:
         self, current_positions: Dict[str, Dict[str, Any]]
     ) -> float:
         """Calculate diversification factor based on current positions."""
-        if not current_positions:
-            return 1.0
-
-        # Simple diversification: more positions = lower individual position size
-        position_count = len(current_positions)
-        max_positions = self.risk_manager.params.max_open_positions
-
-        diversification_factor = max(0.5, 1.0 - (position_count / max_positions) * 0.5)
-        return diversification_factor
+        return diversification_factor(
+            len(current_positions), self.risk_manager.params.max_open_positions
+        )
 
     def should_execute_trade(
         self,
@@ -267,15 +264,15 @@ class PortfolioManager:
 
         execution_decision = validation["valid"]
 
-        # Override decision based on portfolio risk
-        if (
-            portfolio_risk["risk_level"] == "high"
-            and combined_signal.combined_probabilities.get_risk_score() > 0.6
-        ):
-            execution_decision = False
-            validation["errors"].append(
-                "Portfolio risk too high for additional positions"
-            )
+        # Override decision based on portfolio risk; the signal's risk score
+        # is only computed when the portfolio is already at high risk
+        if portfolio_risk.get("risk_level") == "high":
+            risk_score = combined_signal.combined_probabilities.get_risk_score()
+            if risk_score > 0.6:
+                execution_decision = False
+                validation["errors"].append(
+                    "Portfolio risk too high for additional positions"
+                )
 
         decision_metadata = {
             "validation_result": validation,
@@ -283,7 +280,7 @@ class PortfolioManager:
             "position_size_calculation": size_metadata,
             "combined_signal_metadata": combined_signal.metadata,
             "final_decision": execution_decision,
-            "decision_timestamp": datetime.now().isoformat(),
+            "decision_timestamp": now_iso(),
         }
 
         return execution_decision, decision_metadata
@@ -299,18 +296,32 @@ class PortfolioManager:
             return
 
         # Simple rebalancing: increase weights for better performing strategies
-        for strategy_name, performance in performance_data.items():
-            if strategy_name in self.strategy_weights:
-                current_weight = self.strategy_weights[strategy_name].weight
-
-                # Adjust weight based on performance (simple linear adjustment)
-                adjustment = (performance - 0.5) * 0.1  # ±10% max adjustment
-                new_weight = max(0.1, min(0.9, current_weight + adjustment))
+        names = [name for name in performance_data if name in self.strategy_weights]
+        current = np.fromiter(
+            (self.strategy_weights[name].weight for name in names),
+            dtype=np.float64,
+            count=len(names),
+        )
+        performance = np.fromiter(
+            (performance_data[name] for name in names),
+            dtype=np.float64,
+            count=len(names),
+        )
 
-                self.strategy_weights[strategy_name].weight = new_weight
+        # Adjust weights based on performance (simple linear adjustment)
+        adjusted = np.clip(current + (performance - 0.5) * 0.1, 0.1, 0.9)
 
+        log_adjustments = logging.getLogger().isEnabledFor(logging.INFO)
+        for name, current_weight, new_weight in zip(
+            names, current.tolist(), adjusted.tolist()
+        ):
+            self.strategy_weights[name].weight = new_weight
+            if log_adjustments:
                 logging.info(
-                    f"Adjusted {strategy_name} weight: {current_weight:.2f} -> {new_weight:.2f}"
+                    "Adjusted %s weight: %.2f -> %.2f",
+                    name,
+                    current_weight,
+                    new_weight,
                 )
 
         # Normalize weights to sum to 1.0
@@ -318,20 +329,17 @@ class PortfolioManager:
 
     def _normalize_weights(self):
         """Normalize strategy weights to sum to 1.0."""
-        enabled_strategies = {
-            name: sw for name, sw in self.strategy_weights.items() if sw.enabled
-        }
-
-        if not enabled_strategies:
-            return
-
-        total_weight = sum(sw.weight for sw in enabled_strategies.values())
+        self._refresh_enabled_cache()
+        total_weight = self._sum_enabled_weight
 
         if total_weight > 0:
-            for strategy_weight in enabled_strategies.values():
+            for name in self._enabled_names:
+                strategy_weight = self.strategy_weights[name]
                 strategy_weight.weight = strategy_weight.weight / total_weight
 
-    def _create_hold_signal(self, reason: str) -> CombinedSignal:
+    def _create_hold_signal(
+        self, reason: str, timestamp: Optional[str] = None
+    ) -> CombinedSignal:
         """Create a default hold signal."""
         prob_data = ProbabilityData(
             probability_buy=0.2,
@@ -345,7 +353,10 @@ class PortfolioManager:
             combined_confidence=0.0,
             combined_probabilities=prob_data,
             individual_signals={},
-            metadata={"reason": reason, "timestamp": datetime.now().isoformat()},
+            metadata={
+                "reason": reason,
+                "timestamp": timestamp or now_iso(),
+            },
         )
 
     def get_portfolio_summary(
@@ -361,22 +372,27 @@ class PortfolioManager:
             Portfolio summary with risk metrics
         """
         portfolio_risk = self.risk_manager.assess_portfolio_risk(current_positions)
-
-        strategy_info = {
-            name: {
-                "weight": sw.weight,
-                "enabled": sw.enabled,
-                "min_confidence": sw.min_confidence,
+        self._refresh_enabled_cache()
+
+        # Reset by _refresh_enabled_cache whenever any strategy setting changes
+        strategy_info = self._strategy_info_cache
+        if strategy_info is None:
+            strategy_info = self._strategy_info_cache = {
+                name: {
+                    "weight": sw.weight,
+                    "enabled": sw.enabled,
+                    "min_confidence": sw.min_confidence,
+                }
+                for name, sw in self.strategy_weights.items()
             }
-            for name, sw in self.strategy_weights.items()
-        }
 
         return {
             "portfolio_risk": portfolio_risk,
-            "strategy_weights": strategy_info,
+            # Copy the per-strategy dicts too so callers cannot edit the cache
+            "strategy_weights": {
+                name: dict(info) for name, info in strategy_info.items()
+            },
             "total_strategies": len(self.strategy_weights),
-            "enabled_strategies": sum(
-                1 for sw in self.strategy_weights.values() if sw.enabled
-            ),
-            "summary_timestamp": datetime.now().isoformat(),
+            "enabled_strategies": len(self._enabled_names),
+            "summary_timestamp": now_iso(),
         }
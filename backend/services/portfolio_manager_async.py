@@ -1,15 +1,35 @@
 """Portfolio management service for combining multiple strategy signals - async version."""
 
+import asyncio
+import itertools
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
+from backend.services.portfolio_core import (
+    COMBINE_METADATA,
+    combine_signals_core,
+    diversification_factor,
+    now_iso,
+)
 from backend.services.risk_manager_async import ProbabilityData, RiskManagerAsync
 from backend.strategies.sample_strategy import TradeSignal
 
+# Shared read-only stand-in for signals that carry no indicators
+_EMPTY_INDICATORS = MappingProxyType({})
+
+
+# Changes whenever any StrategyWeight field is assigned, so managers can tell
+# that a setting changed, even one edited directly by a caller, in O(1)
+_version_counter = itertools.count()
+_weights_version = next(_version_counter)
+
 
-@dataclass
+@dataclass(slots=True)
 class StrategyWeight:
     """Weight configuration for a strategy."""
 
@@ -18,8 +38,14 @@ class StrategyWeight:
     min_confidence: float = 0.5
     enabled: bool = True
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        global _weights_version
 
-@dataclass
+        object.__setattr__(self, name, value)
+        _weights_version = next(_version_counter)
+
+
+@dataclass(slots=True, frozen=True)
 class CombinedSignal:
     """Combined signal from multiple strategies."""
 
@@ -34,7 +60,10 @@ class PortfolioManagerAsync:
     """Async service for managing portfolio with multiple strategies."""
 
     def __init__(
-        self, risk_manager: RiskManagerAsync, strategy_weights: List[StrategyWeight]
+        self,
+        risk_manager: RiskManagerAsync,
+        strategy_weights: List[StrategyWeight],
+        concurrency_limit: int = 16,
     ):
         """
         Initialize portfolio manager.
@@ -42,131 +71,116 @@ class PortfolioManagerAsync:
         Args:
             risk_manager: Risk management service
             strategy_weights: List of strategy configurations with weights
+            concurrency_limit: Maximum risk manager calls in flight at once
         """
         self.risk_manager = risk_manager
+        self.concurrency_limit = concurrency_limit
+        self._risk_sem = asyncio.Semaphore(concurrency_limit)
         self.strategy_weights = {sw.strategy_name: sw for sw in strategy_weights}
+        self._cached_key: Optional[Tuple[int, int, int]] = None
         self._validate_weights()
 
+    def _settings_key(self) -> Tuple[int, int, int]:
+        """Key that changes when any strategy setting or the strategy set does."""
+        return (_weights_version, id(self.strategy_weights), len(self.strategy_weights))
+
+    def _refresh_enabled_cache(self) -> None:
+        """
+        Rebuild the cached view of enabled strategies after weight changes.
+
+        Changes are detected through the StrategyWeight version counter, so
+        objects edited directly by callers are picked up too.
+        """
+        key = self._settings_key()
+        if key == self._cached_key:
+            return
+
+        enabled = [sw for sw in self.strategy_weights.values() if sw.enabled]
+        self._enabled_names = [sw.strategy_name for sw in enabled]
+        self._enabled_weights_np = np.array(
+            [sw.weight for sw in enabled], dtype=np.float64
+        )
+        # name -> (weight, min_confidence) read by the signal combination loop
+        self._enabled_lookup = {
+            sw.strategy_name: (sw.weight, sw.min_confidence) for sw in enabled
+        }
+        self._sum_enabled_weight = float(self._enabled_weights_np.sum())
+        self._active_strategies_cache: Optional[Dict[str, Dict[str, float]]] = None
+        self._cached_key = key
+
     def _validate_weights(self):
         """Validate that strategy weights sum to reasonable values."""
-        enabled_weights = [
-            sw.weight for sw in self.strategy_weights.values() if sw.enabled
-        ]
-        total_weight = sum(enabled_weights)
+        self._refresh_enabled_cache()
+        total_weight = self._sum_enabled_weight
 
         if total_weight > 1.1 or total_weight < 0.9:
             logging.warning(
-                f"Strategy weights sum to {total_weight:.2f}, consider normalizing"
+                "Strategy weights sum to %.2f, consider normalizing", total_weight
             )
 
-    async def combine_strategy_signals(
+    def combine_strategy_signals(
         self,
         strategy_signals: Dict[str, TradeSignal],
         symbol: str,
         current_price: float,
+        timestamp: Optional[str] = None,
     ) -> CombinedSignal:
         """
-        Combine signals from multiple strategies into a single decision asynchronously.
+        Combine signals from multiple strategies into a single decision.
 
         Args:
             strategy_signals: Dict of strategy_name -> TradeSignal
             symbol: Trading symbol
             current_price: Current price for the symbol
+            timestamp: Metadata timestamp shared by a batch, defaults to now
 
         Returns:
             CombinedSignal with combined probabilities and action
         """
+        timestamp = timestamp or now_iso()
+
         if not strategy_signals:
-            return await self._create_hold_signal("No strategy signals provided")
-
-        # Filter valid signals and apply weights
-        valid_signals = {}
-        weighted_buy_prob = 0.0
-        weighted_sell_prob = 0.0
-        weighted_hold_prob = 0.0
-        weighted_confidence = 0.0
-        total_weight = 0.0
-
-        for strategy_name, signal in strategy_signals.items():
-            if strategy_name not in self.strategy_weights:
-                logging.warning(f"Unknown strategy: {strategy_name}")
-                continue
-
-            weight_config = self.strategy_weights[strategy_name]
-
-            if not weight_config.enabled:
-                continue
-
-            if signal.confidence < weight_config.min_confidence:
-                logging.info(f"Signal from {strategy_name} below minimum confidence")
-                continue
-
-            # Extract probabilities from signal metadata
-            metadata = signal.metadata or {}
-            prob_buy = metadata.get("probability_buy", 0.33)
-            prob_sell = metadata.get("probability_sell", 0.33)
-            prob_hold = metadata.get("probability_hold", 0.34)
-
-            # Apply strategy weight
-            weight = weight_config.weight
-            weighted_buy_prob += prob_buy * weight
-            weighted_sell_prob += prob_sell * weight
-            weighted_hold_prob += prob_hold * weight
-            weighted_confidence += signal.confidence * weight
-            total_weight += weight
-
-            valid_signals[strategy_name] = signal
-
-        if total_weight == 0:
-            return await self._create_hold_signal("No valid signals after filtering")
-
-        # Normalize probabilities
-        if total_weight > 0:
-            combined_buy_prob = weighted_buy_prob / total_weight
-            combined_sell_prob = weighted_sell_prob / total_weight
-            combined_hold_prob = weighted_hold_prob / total_weight
-            combined_confidence = weighted_confidence / total_weight
-        else:
-            combined_buy_prob = combined_sell_prob = 0.33
-            combined_hold_prob = 0.34
-            combined_confidence = 0.0
-
-        # Determine final action
-        probabilities = [
-            ("buy", combined_buy_prob),
-            ("sell", combined_sell_prob),
-            ("hold", combined_hold_prob),
-        ]
+            return self._create_hold_signal("No strategy signals provided", timestamp)
 
-        # Choose action with highest probability
-        final_action = max(probabilities, key=lambda x: x[1])[0]
+        self._refresh_enabled_cache()
+        combination = combine_signals_core(
+            self._enabled_lookup, self.strategy_weights, strategy_signals
+        )
+        if combination is None:
+            return self._create_hold_signal(
+                "No valid signals after filtering", timestamp
+            )
 
-        # Create combined probability data
+        buy_prob, sell_prob, hold_prob = combination.probabilities
         combined_prob_data = ProbabilityData(
-            probability_buy=combined_buy_prob,
-            probability_sell=combined_sell_prob,
-            probability_hold=combined_hold_prob,
-            confidence=combined_confidence,
+            probability_buy=buy_prob,
+            probability_sell=sell_prob,
+            probability_hold=hold_prob,
+            confidence=combination.confidence,
         )
 
         metadata = {
+            **COMBINE_METADATA,
             "symbol": symbol,
             "current_price": current_price,
-            "strategies_used": list(valid_signals.keys()),
-            "total_weight": total_weight,
-            "combination_method": "weighted_average",
-            "timestamp": datetime.now().isoformat(),
+            "strategies_used": combination.strategy_names,
+            "total_weight": combination.total_weight,
+            "timestamp": timestamp,
         }
 
         return CombinedSignal(
-            action=final_action,
-            combined_confidence=combined_confidence,
+            action=combination.action,
+            combined_confidence=combination.confidence,
             combined_probabilities=combined_prob_data,
-            individual_signals=valid_signals,
+            individual_signals=dict(
+                zip(combination.strategy_names, combination.signals)
+            ),
             metadata=metadata,
         )
 
-    async def _create_hold_signal(self, reason: str) -> CombinedSignal:
+    def _create_hold_signal(
+        self, reason: str, timestamp: Optional[str] = None
+    ) -> CombinedSignal:
         """Create a neutral 'hold' signal with metadata."""
         prob_data = ProbabilityData(
             probability_buy=0.2,
@@ -180,7 +194,10 @@ class PortfolioManagerAsync:
             combined_confidence=0.5,
             combined_probabilities=prob_data,
             individual_signals={},
-            metadata={"reason": reason, "timestamp": datetime.now().isoformat()},
+            metadata={
+                "reason": reason,
+                "timestamp": timestamp or now_iso(),
+            },
         )
 
     async def calculate_portfolio_position_size(
@@ -203,14 +220,15 @@ class PortfolioManagerAsync:
             Tuple of (position_size, calculation_metadata)
         """
         # Use intelligent position sizing with combined probabilities
-        position_size, metadata = (
-            await self.risk_manager.calculate_intelligent_position_size(
-                signal_confidence=combined_signal.combined_confidence,
-                portfolio_value=portfolio_value,
-                current_positions=current_positions,
-                probability_data=combined_signal.combined_probabilities,
+        async with self._risk_sem:
+            position_size, metadata = (
+                await self.risk_manager.calculate_intelligent_position_size(
+                    signal_confidence=combined_signal.combined_confidence,
+                    portfolio_value=portfolio_value,
+                    current_positions=current_positions,
+                    probability_data=combined_signal.combined_probabilities,
+                )
             )
-        )
 
         # Add portfolio-specific metadata
         metadata.update(
@@ -218,7 +236,7 @@ class PortfolioManagerAsync:
                 "symbol": symbol,
                 "combined_signal_action": combined_signal.action,
                 "strategies_count": len(combined_signal.individual_signals),
-                "portfolio_diversification_factor": await self._calculate_diversification_factor(
+                "portfolio_diversification_factor": self._calculate_diversification_factor(
                     current_positions
                 ),
             }
@@ -226,19 +244,13 @@ class PortfolioManagerAsync:
 
         return position_size, metadata
 
-    async def _calculate_diversification_factor(
+    def _calculate_diversification_factor(
         self, current_positions: Dict[str, Dict[str, Any]]
     ) -> float:
-        """Calculate diversification factor based on current positions asynchronously."""
-        if not current_positions:
-            return 1.0
-
-        # Simple diversification: more positions = lower individual position size
-        position_count = len(current_positions)
-        max_positions = self.risk_manager.params.max_open_positions
-
-        diversification_factor = max(0.5, 1.0 - (position_count / max_positions) * 0.5)
-        return diversification_factor
+        """Calculate diversification factor based on current positions."""
+        return diversification_factor(
+            len(current_positions), self.risk_manager.params.max_open_positions
+        )
 
     async def should_execute_trade(
         self,
@@ -261,12 +273,46 @@ class PortfolioManagerAsync:
         Returns:
             Tuple of (should_execute, decision_metadata)
         """
+        # A hold never executes, so skip position sizing and risk validation
+        if combined_signal.action == "hold":
+            return self._hold_decision(combined_signal, symbol, now_iso())
+
         # Create order data for validation
         position_size, size_metadata = await self.calculate_portfolio_position_size(
             combined_signal, portfolio_value, current_positions, symbol
         )
 
-        order_data = {
+        # Get risk assessment
+        async with self._risk_sem:
+            validation_result = (
+                await self.risk_manager.validate_order_with_probabilities(
+                    order_data=self._order_data(
+                        combined_signal, symbol, position_size, current_price
+                    ),
+                    portfolio_value=portfolio_value,
+                    current_positions=current_positions,
+                    probability_data=combined_signal.combined_probabilities,
+                )
+            )
+
+        return self._trade_decision(
+            combined_signal,
+            symbol,
+            position_size,
+            size_metadata,
+            validation_result,
+            now_iso(),
+        )
+
+    def _order_data(
+        self,
+        combined_signal: CombinedSignal,
+        symbol: str,
+        position_size: float,
+        current_price: float,
+    ) -> Dict[str, Any]:
+        """Build the order payload validated by the risk manager."""
+        return {
             "symbol": symbol,
             "side": combined_signal.action,  # buy or sell
             "type": "market",
@@ -274,14 +320,29 @@ class PortfolioManagerAsync:
             "price": current_price,
         }
 
-        # Get risk assessment
-        validation_result = await self.risk_manager.validate_order_with_probabilities(
-            order_data=order_data,
-            portfolio_value=portfolio_value,
-            current_positions=current_positions,
-            probability_data=combined_signal.combined_probabilities,
-        )
+    def _hold_decision(
+        self, combined_signal: CombinedSignal, symbol: str, timestamp: str
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """Decision for a hold signal, which never executes."""
+        return False, {
+            "symbol": symbol,
+            "action": "hold",
+            "confidence": combined_signal.combined_confidence,
+            "position_size": 0.0,
+            "reason": "hold_signal",
+            "timestamp": timestamp,
+        }
 
+    def _trade_decision(
+        self,
+        combined_signal: CombinedSignal,
+        symbol: str,
+        position_size: float,
+        size_metadata: Dict[str, Any],
+        validation_result: Dict[str, Any],
+        timestamp: str,
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """Combine sizing and risk validation into an execution decision."""
         # Determine if we should execute
         should_execute = (
             validation_result["valid"]
@@ -297,14 +358,12 @@ class PortfolioManagerAsync:
             "position_size": position_size,
             "position_size_metadata": size_metadata,
             "risk_validation": validation_result,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
         return should_execute, metadata
 
-    async def rebalance_portfolio_weights(
-        self, performance_data: Dict[str, float]
-    ) -> None:
+    def rebalance_portfolio_weights(self, performance_data: Dict[str, float]) -> None:
         """
         Rebalance strategy weights based on performance data.
 
@@ -315,14 +374,26 @@ class PortfolioManagerAsync:
             return
 
         # Simple rebalancing algorithm: adjust weights based on performance
-        for strategy_name, performance in performance_data.items():
-            if strategy_name in self.strategy_weights:
-                # Adjust weight based on performance (normalize between 0.5 and 1.5)
-                normalized_performance = max(0.5, min(1.5, performance))
-                self.strategy_weights[strategy_name].weight *= normalized_performance
+        names = [name for name in performance_data if name in self.strategy_weights]
+        current = np.fromiter(
+            (self.strategy_weights[name].weight for name in names),
+            dtype=np.float64,
+            count=len(names),
+        )
+        performance = np.fromiter(
+            (performance_data[name] for name in names),
+            dtype=np.float64,
+            count=len(names),
+        )
+
+        # Adjust weights based on performance (normalize between 0.5 and 1.5)
+        adjusted = current * np.clip(performance, 0.5, 1.5)
+
+        for name, new_weight in zip(names, adjusted.tolist()):
+            self.strategy_weights[name].weight = new_weight
 
         # Normalize weights
-        await self._normalize_weights()
+        self._normalize_weights()
 
     async def process_signals(
         self, signals: List[Dict[str, Any]]
@@ -336,79 +407,106 @@ class PortfolioManagerAsync:
         Returns:
             List of recommended trading actions
         """
-        actions = []
+        timestamp = now_iso()
 
-        # Group signals by symbol
-        symbols_signals = {}
+        # Group signals by symbol, keeping the first price seen per symbol
+        symbols_signals = defaultdict(dict)
+        symbol_prices = {}
         for signal in signals:
             symbol = signal.get("symbol")
-            if symbol not in symbols_signals:
-                symbols_signals[symbol] = {}
+            if symbol not in symbol_prices:
+                symbol_prices[symbol] = signal.get("price", 0.0)
 
             strategy_name = signal.get("source", "unknown")
-            signals_dict = {
-                "action": signal.get("signal_type"),
-                "confidence": signal.get("confidence", 0.5),
-                "metadata": {
-                    "probability_buy": signal.get("indicators", {}).get(
-                        "probability_buy", 0.33
-                    ),
-                    "probability_sell": signal.get("indicators", {}).get(
-                        "probability_sell", 0.33
-                    ),
-                    "probability_hold": signal.get("indicators", {}).get(
-                        "probability_hold", 0.34
-                    ),
-                },
-            }
+            indicators = signal.get("indicators") or _EMPTY_INDICATORS
 
             # Convert to TradeSignal
-            trade_signal = TradeSignal(
-                action=signals_dict["action"],
-                confidence=signals_dict["confidence"],
-                metadata=signals_dict["metadata"],
+            symbols_signals[symbol][strategy_name] = TradeSignal(
+                action=signal.get("signal_type"),
+                confidence=signal.get("confidence", 0.5),
+                metadata={
+                    "probability_buy": indicators.get("probability_buy", 0.33),
+                    "probability_sell": indicators.get("probability_sell", 0.33),
+                    "probability_hold": indicators.get("probability_hold", 0.34),
+                },
             )
 
-            symbols_signals[symbol][strategy_name] = trade_signal
-
-        # Process each symbol's signals
-        for symbol, strategy_signals in symbols_signals.items():
-            # Get current price from the first signal for this symbol
-            price = next(
-                (s.get("price", 0.0) for s in signals if s.get("symbol") == symbol), 0.0
+        # Mock portfolio value and positions for demo
+        portfolio_value = 100000.0  # Mock portfolio value
+        current_positions = {}  # Mock current positions
+
+        combined_signals = [
+            (
+                symbol,
+                symbol_prices[symbol],
+                self.combine_strategy_signals(
+                    strategy_signals=strategy_signals,
+                    symbol=symbol,
+                    current_price=symbol_prices[symbol],
+                    timestamp=timestamp,
+                ),
             )
+            for symbol, strategy_signals in symbols_signals.items()
+        ]
+        tradable = [entry for entry in combined_signals if entry[2].action != "hold"]
 
-            # Combine signals for this symbol
-            combined_signal = await self.combine_strategy_signals(
-                strategy_signals=strategy_signals, symbol=symbol, current_price=price
+        # Size all tradable symbols concurrently, then validate them in one call
+        sizes = await asyncio.gather(
+            *(
+                self.calculate_portfolio_position_size(
+                    combined_signal, portfolio_value, current_positions, symbol
+                )
+                for symbol, _, combined_signal in tradable
             )
-
-            # Mock portfolio value and positions for demo
-            portfolio_value = 100000.0  # Mock portfolio value
-            current_positions = {}  # Mock current positions
-
-            # Determine if we should execute a trade
-            should_execute, metadata = await self.should_execute_trade(
-                combined_signal=combined_signal,
-                portfolio_value=portfolio_value,
-                current_positions=current_positions,
-                symbol=symbol,
-                current_price=price,
+        )
+        validations = []
+        if tradable:
+            async with self._risk_sem:
+                validations = await self.risk_manager.validate_orders_batch(
+                    orders=[
+                        self._order_data(combined_signal, symbol, size, price)
+                        for (symbol, price, combined_signal), (size, _) in zip(
+                            tradable, sizes
+                        )
+                    ],
+                    portfolio_value=portfolio_value,
+                    current_positions=current_positions,
+                    probability_datas=[
+                        combined_signal.combined_probabilities
+                        for _, _, combined_signal in tradable
+                    ],
+                )
+        decisions = {
+            symbol: self._trade_decision(
+                combined_signal, symbol, *sized, validation_result, timestamp
+            )
+            for (symbol, _, combined_signal), sized, validation_result in zip(
+                tradable, sizes, validations
             )
+        }
 
-            # Create action recommendation
-            action = {
-                "symbol": symbol,
-                "action": combined_signal.action,
-                "confidence": combined_signal.combined_confidence,
-                "should_execute": should_execute,
-                "position_size": metadata.get("position_size", 0.0),
-                "price": price,
-                "timestamp": datetime.now().isoformat(),
-                "metadata": metadata,
-            }
+        actions = []
+        for symbol, price, combined_signal in combined_signals:
+            if combined_signal.action == "hold":
+                should_execute, metadata = self._hold_decision(
+                    combined_signal, symbol, timestamp
+                )
+            else:
+                should_execute, metadata = decisions[symbol]
 
-            actions.append(action)
+            # Create action recommendation
+            actions.append(
+                {
+                    "symbol": symbol,
+                    "action": combined_signal.action,
+                    "confidence": combined_signal.combined_confidence,
+                    "should_execute": should_execute,
+                    "position_size": metadata.get("position_size", 0.0),
+                    "price": price,
+                    "timestamp": timestamp,
+                    "metadata": metadata,
+                }
+            )
 
         return actions
 
@@ -430,6 +528,7 @@ class PortfolioManagerAsync:
             List of allocation recommendations
         """
         allocations = []
+        timestamp = now_iso()
 
         # Convert risk profile to factor
         risk_factors = {"conservative": 0.5, "moderate": 0.75, "aggressive": 1.0}
@@ -442,46 +541,46 @@ class PortfolioManagerAsync:
         buy_actions = [
             a for a in actions if a["action"] == "buy" and a["should_execute"]
         ]
-        total_buy_confidence = sum(a["confidence"] for a in buy_actions)
-
-        # Calculate allocations based on confidence and risk profile
-        for action in buy_actions:
-            if total_buy_confidence > 0:
-                # Weight by confidence
-                allocation_weight = action["confidence"] / total_buy_confidence
+        confidences = np.fromiter(
+            (a["confidence"] for a in buy_actions),
+            dtype=np.float64,
+            count=len(buy_actions),
+        )
+        total_buy_confidence = float(confidences.sum())
+        if total_buy_confidence <= 0:
+            return allocations
 
-                # Apply risk profile and max allocation
-                allocation_percent = (
-                    allocation_weight * max_allocation_percent * risk_factor
-                )
+        # Weight by confidence, then apply risk profile and max allocation
+        allocation_percents = confidences * (
+            max_allocation_percent * risk_factor / total_buy_confidence
+        )
 
-                allocations.append(
-                    {
-                        "symbol": action["symbol"],
-                        "percentage": allocation_percent,
-                        "action": "buy",
-                        "target_allocation": allocation_percent,
-                        "current_allocation": 0.0,  # This would be from current portfolio
-                        "confidence": action["confidence"],
-                        "price": action["price"],
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                )
+        for action, allocation_percent in zip(
+            buy_actions, allocation_percents.tolist()
+        ):
+            allocations.append(
+                {
+                    "symbol": action["symbol"],
+                    "percentage": allocation_percent,
+                    "action": "buy",
+                    "target_allocation": allocation_percent,
+                    "current_allocation": 0.0,  # This would be from current portfolio
+                    "confidence": action["confidence"],
+                    "price": action["price"],
+                    "timestamp": timestamp,
+                }
+            )
 
         return allocations
 
-    async def _normalize_weights(self) -> None:
+    def _normalize_weights(self) -> None:
         """Normalize strategy weights to sum to 1.0."""
-        enabled_weights = [
-            (name, sw.weight)
-            for name, sw in self.strategy_weights.items()
-            if sw.enabled
-        ]
-        total_weight = sum(w for _, w in enabled_weights)
+        self._refresh_enabled_cache()
+        total_weight = self._sum_enabled_weight
 
         if total_weight > 0:
             # Normalize weights
-            for name, _ in enabled_weights:
+            for name in self._enabled_names:
                 self.strategy_weights[name].weight /= total_weight
 
     async def get_portfolio_summary(
@@ -506,15 +605,14 @@ class PortfolioManagerAsync:
         risk_assessment = await self.risk_manager.assess_portfolio_risk(
             current_positions
         )
+        self._refresh_enabled_cache()
 
         return {
             "total_positions": total_positions,
             "total_exposure": total_exposure,
             "risk_assessment": risk_assessment,
-            "active_strategies": [
-                name for name, sw in self.strategy_weights.items() if sw.enabled
-            ],
-            "timestamp": datetime.now().isoformat(),
+            "active_strategies": list(self._enabled_names),
+            "timestamp": now_iso(),
         }
 
     async def get_portfolio_status(self) -> Dict[str, Any]:
@@ -563,12 +661,14 @@ class PortfolioManagerAsync:
         else:
             weighted_pnl_percentage = 0.0
 
-        # Get active strategy weights
-        active_strategies = {
-            name: {"weight": sw.weight, "min_confidence": sw.min_confidence}
-            for name, sw in self.strategy_weights.items()
-            if sw.enabled
-        }
+        # Get active strategy weights; _refresh_enabled_cache resets this cache
+        # whenever any strategy setting changes
+        self._refresh_enabled_cache()
+        if self._active_strategies_cache is None:
+            self._active_strategies_cache = {
+                name: {"weight": weight, "min_confidence": min_confidence}
+                for name, (weight, min_confidence) in self._enabled_lookup.items()
+            }
 
         return {
             "total_value": total_value,
@@ -577,8 +677,11 @@ class PortfolioManagerAsync:
             "total_pnl": total_pnl,
             "pnl_percentage": weighted_pnl_percentage,
             "risk_summary": summary["risk_assessment"],
-            "active_strategies": active_strategies,
-            "timestamp": datetime.now().isoformat(),
+            # Copy the per-strategy dicts too so callers cannot edit the cache
+            "active_strategies": {
+                name: dict(info) for name, info in self._active_strategies_cache.items()
+            },
+            "timestamp": now_iso(),
         }
 
     async def rebalance_portfolio(
@@ -593,6 +696,8 @@ class PortfolioManagerAsync:
         Returns:
             Dict with rebalancing results
         """
+        timestamp = now_iso()
+
         # Mock current positions and portfolio value for demo
         current_positions = {
             "BTC/USD": {
@@ -611,9 +716,10 @@ class PortfolioManagerAsync:
 
         portfolio_value = sum(pos.get("value", 0) for pos in current_positions.values())
 
-        # Calculate current allocations
+        # Calculate current allocations with one division for the whole portfolio
+        inv_portfolio_value = 1.0 / portfolio_value if portfolio_value > 0 else 0.0
         current_allocations = {
-            pos["symbol"]: pos["value"] / portfolio_value if portfolio_value > 0 else 0
+            pos["symbol"]: pos["value"] * inv_portfolio_value
             for pos in current_positions.values()
         }
 
@@ -666,18 +772,18 @@ class PortfolioManagerAsync:
                     "amount": abs(amount),
                     "price": current_price,
                     "value": abs(action_value),
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                 }
             )
 
         return {
             "portfolio_value": portfolio_value,
             "actions": rebalancing_actions,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
 
-async def get_portfolio_manager_async(
+def get_portfolio_manager_async(
     risk_manager: RiskManagerAsync, strategy_weights: List[StrategyWeight]
 ) -> PortfolioManagerAsync:
     """
@@ -3,14 +3,118 @@
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
-from backend.services.cache_service import get_cache_service
+from backend.services.cache_service import EnhancedCacheService, get_cache_service
 from backend.services.exchange import ExchangeError
-from backend.services.exchange_async import (
-    _exchange_instance as async_exchange_instance,
+from backend.services.exchange_async import fetch_tickers_async, get_exchange_instance
+from backend.services.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# Major cryptocurrencies shown as positions, with the USD pair used to price
+# them. Paper trading currencies are priced with their live counterpart.
+_CRYPTO_SYMBOLS = (
+    ("TESTBTC", "BTC/USD"),
+    ("TESTETH", "ETH/USD"),
+    ("TESTLTC", "LTC/USD"),
+    ("BTC", "BTC/USD"),
+    ("ETH", "ETH/USD"),
+    ("LTC", "LTC/USD"),
 )
 
+# Positions together with their encoded {"positions": [...]} response body
+PositionsPayload = Tuple[List[Dict[str, Any]], bytes]
+
+_EMPTY_PAYLOAD: PositionsPayload = ([], dumps({"positions": []}))
+
+# Position fetches in progress per event loop, keyed by cache key. Futures
+# belong to the loop that created them, so loops never share a fetch.
+_inflight_fetches: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Positions are refetched after the TTL, but served stale while a background
+# refresh runs until they are twice that old
+_POSITIONS_TTL_SECONDS = 20
+_POSITIONS_STALE_SECONDS = 2 * _POSITIONS_TTL_SECONDS
+
+# Monotonic time of the last completed fetch per cache key, least recently
+# used first. The symbols filter comes from the query string, so at most
+# _MAX_CACHED_KEYS keys are kept and the positions cached under evicted keys
+# are dropped too, keeping arbitrary filters from growing either without bound.
+_fetched_at: "OrderedDict[str, float]" = OrderedDict()
+_MAX_CACHED_KEYS = 64
+
+
+@lru_cache(maxsize=32)
+def _positions_cache_key(symbols: Optional[FrozenSet[str]]) -> str:
+    """
+    Cache key for a set of requested symbols.
+
+    Keyed on a frozenset so the same symbols in a different order, or with
+    duplicates, share one cache entry.
+
+    Args:
+        symbols: Requested symbols, or None for all positions
+
+    Returns:
+        str: Cache service key
+    """
+    if not symbols:
+        return "positions_all"
+    return "positions_" + ",".join(sorted(symbols))
+
+
+def _build_position(
+    crypto: str,
+    symbol: str,
+    amount: float,
+    price: float,
+    position_type: str,
+    now_s: int,
+    now_ms: int,
+) -> Dict[str, Any]:
+    """
+    Build a position from a cryptocurrency holding.
+
+    Margin-classified holdings get cross margin with a 10% maintenance
+    margin; everything else is a 1:1 spot position.
+
+    Args:
+        crypto: Currency code of the holding (e.g. "BTC")
+        symbol: USD pair the holding is priced with
+        amount: Held amount
+        price: Current price of the pair
+        position_type: Position type from order metadata
+        now_s: Current time in seconds, used in the position id
+        now_ms: Current time in milliseconds
+
+    Returns:
+        Position dictionary
+    """
+    value = amount * price
+    is_margin = position_type == "margin"
+    return {
+        "id": f"{'margin' if is_margin else 'spot'}_{crypto}_{now_s}",
+        "symbol": symbol,
+        "side": "buy",  # Holdings are always long
+        "amount": amount,
+        "entry_price": price,
+        "mark_price": price,
+        "pnl": 0.0,  # Would need historical entry data
+        "pnl_percentage": 0.0,
+        "timestamp": now_ms,
+        "contracts": amount,
+        "notional": value,
+        "collateral": value,
+        "margin_mode": "cross" if is_margin else "spot",
+        "maintenance_margin": value * 0.1 if is_margin else 0.0,
+        "position_type": position_type,  # From meta
+        "leverage": 1.0,  # Conservative estimate, spot is always 1:1
+    }
+
 
 async def get_position_type_from_metadata_async(symbol: str) -> str:
     """
@@ -46,41 +150,151 @@ async def fetch_positions_async(
     Returns:
         List of position dictionaries with live data from Bitfinex
 
+    Raises:
+        ExchangeError: If Bitfinex API call fails
+    """
+    positions, _ = await fetch_positions_payload_async(symbols)
+    return positions
+
+
+async def fetch_positions_payload_async(
+    symbols: Optional[List[str]] = None,
+) -> PositionsPayload:
+    """
+    Fetch positions together with their JSON-encoded response body.
+
+    The body is encoded once per exchange fetch and cached with the
+    positions, so cache hits can be sent to clients without encoding again.
+    Results older than the TTL are still returned while a background fetch
+    refreshes them, until they reach the stale window.
+
+    Args:
+        symbols: Optional list of symbols to filter by
+
+    Returns:
+        Tuple of the position list and the encoded {"positions": [...]} body
+
     Raises:
         ExchangeError: If Bitfinex API call fails
     """
     cache = get_cache_service()
-    cache_key = f"positions_{symbols or 'all'}"
+    symbol_set = frozenset(symbols) if symbols else None
+    cache_key = _positions_cache_key(symbol_set)
+
+    # Fresh entries are served as is. Entries past the TTL but within the
+    # stale window are still served, while one refresh runs in the background.
+    cached = cache.get(cache_key, ttl_seconds=_POSITIONS_STALE_SECONDS)
+    if cached is not None:
+        fetched_at = _fetched_at.get(cache_key)
+        if fetched_at is not None:
+            _fetched_at.move_to_end(cache_key)
+        if (
+            fetched_at is None
+            or time.monotonic() - fetched_at >= _POSITIONS_TTL_SECONDS
+        ):
+            _start_fetch(symbols, symbol_set, cache, cache_key)
+        return cached
+
+    # Shielded so one cancelled request does not cancel the shared fetch
+    return await asyncio.shield(_start_fetch(symbols, symbol_set, cache, cache_key))
+
+
+def _start_fetch(
+    symbols: Optional[List[str]],
+    symbol_set: Optional[FrozenSet[str]],
+    cache: EnhancedCacheService,
+    cache_key: str,
+) -> "asyncio.Future[PositionsPayload]":
+    """
+    Start a positions fetch for a cache key, or join the one already running.
 
-    # Check cache first (20 second TTL for positions)
-    cached_positions = cache.get(cache_key, ttl_seconds=20)
-    if cached_positions is not None:
-        return cached_positions
+    Args:
+        symbols: Optional list of symbols to filter by
+        symbol_set: The same symbols as a frozenset, or None for all
+        cache: Cache service to store the result in
+        cache_key: Key to store the result under
+
+    Returns:
+        Future resolving to the fetched payload
+    """
+    # Share a fetch that is already running for the same key instead of
+    # sending the same exchange requests again
+    loop = asyncio.get_running_loop()
+    fetches = _inflight_fetches.get(loop)
+    if fetches is None:
+        fetches = _inflight_fetches[loop] = {}
+
+    pending = fetches.get(cache_key)
+    if pending is None:
+        pending = asyncio.ensure_future(
+            _fetch_positions(symbols, symbol_set, cache, cache_key)
+        )
+        fetches[cache_key] = pending
+        pending.add_done_callback(lambda done: _finish_fetch(cache_key, done))
+    return pending
+
+
+def _finish_fetch(cache_key: str, done: "asyncio.Future[PositionsPayload]") -> None:
+    """Forget a completed fetch, marking its error as handled."""
+    fetches = _inflight_fetches.get(done.get_loop())
+    if fetches is not None:
+        fetches.pop(cache_key, None)
+    # Background refreshes have no awaiter; _fetch_positions already logged
+    if not done.cancelled():
+        done.exception()
+
+
+async def _fetch_positions(
+    symbols: Optional[List[str]],
+    symbol_set: Optional[FrozenSet[str]],
+    cache: EnhancedCacheService,
+    cache_key: str,
+) -> PositionsPayload:
+    """
+    Fetch positions from the exchange and store them in the cache.
+
+    Args:
+        symbols: Optional list of symbols to filter by
+        symbol_set: The same symbols as a frozenset, or None for all
+        cache: Cache service to store the result in
+        cache_key: Key to store the result under
+
+    Returns:
+        Tuple of the position list and its encoded response body
 
-    if not async_exchange_instance:
-        logging.warning(
+    Raises:
+        ExchangeError: If Bitfinex API call fails
+    """
+    exchange = get_exchange_instance()
+    if not exchange:
+        logger.warning(
             "Async exchange service not available, returning empty positions"
         )
-        return []
+        return _EMPTY_PAYLOAD
 
     try:
-        # STEP 1: Try to fetch traditional margin positions first
+        # Margin positions and balances are independent, so fetch them
+        # concurrently in the thread pool
+        loop = asyncio.get_event_loop()
+        positions, balances = await asyncio.gather(
+            loop.run_in_executor(None, lambda: exchange.fetch_positions(symbols)),
+            loop.run_in_executor(None, exchange.fetch_balance),
+            return_exceptions=True,
+        )
+
+        # STEP 1: Use traditional margin positions if there are any
         traditional_positions = []
-        try:
-            # Använd run_in_executor för att köra den synkrona metoden i en separat tråd
-            loop = asyncio.get_event_loop()
-            positions = await loop.run_in_executor(
-                None, lambda: async_exchange_instance.fetch_positions(symbols)
+        if isinstance(positions, Exception):
+            logger.info(
+                "📊 [Positions Async] No margin positions found "
+                "(normal for spot trading): %s",
+                positions,
             )
+        else:
             traditional_positions = positions
-            logging.info(
-                f"✅ [Positions Async] Fetched {len(traditional_positions)} "
-                f"margin positions"
-            )
-        except Exception as e:
-            logging.info(
-                f"📊 [Positions Async] No margin positions found "
-                f"(normal for spot trading): {e}"
+            logger.info(
+                "✅ [Positions Async] Fetched %d margin positions",
+                len(traditional_positions),
             )
 
         # STEP 2: Create "spot positions" from cryptocurrency holdings
@@ -88,145 +302,121 @@ async def fetch_positions_async(
         margin_positions_from_holdings = []
 
         try:
-            # Hämta balances asynkront
-            loop = asyncio.get_event_loop()
-            balances = await loop.run_in_executor(
-                None, lambda: async_exchange_instance.fetch_balance()
-            )
-
-            # Get current market prices for major cryptocurrencies
-            major_cryptos = ["TESTBTC", "TESTETH", "TESTLTC", "BTC", "ETH", "LTC"]
-
-            # Skapa tasks för alla ticker-anrop för att köra dem parallellt
-            ticker_tasks = {}
-            for crypto in major_cryptos:
-                if crypto in balances and balances[crypto] > 0:
-                    # Determine symbol for price lookup
-                    base_currency = (
-                        crypto.replace("TEST", "")
-                        if crypto.startswith("TEST")
-                        else crypto
+            if isinstance(balances, Exception):
+                raise balances
+
+            # Samla alla innehav och hämta priserna i ett anrop. Valutor utan
+            # saldo eller utanför symbolfiltret hoppas över innan något
+            # API-anrop görs.
+            holdings = [
+                (crypto, symbol, amount)
+                for crypto, symbol in _CRYPTO_SYMBOLS
+                if (amount := balances.get(crypto, 0)) > 0
+                and (symbol_set is None or symbol in symbol_set)
+            ]
+
+            tickers = {}
+            if holdings:
+                needed_symbols = list(dict.fromkeys(s for _, s, _ in holdings))
+                tickers = await fetch_tickers_async(exchange, needed_symbols)
+
+            # One clock reading so every position from this call shares it
+            now = time.time()
+            now_s = int(now)
+            now_ms = int(now * 1000)
+
+            # TEST and live currencies share a symbol, so look each up once
+            position_types: Dict[str, str] = {}
+
+            for crypto, symbol, amount in holdings:
+                ticker = tickers.get(symbol)
+                current_price = ticker.get("last") if ticker else None
+                if current_price is None:
+                    # Skip holdings the batch response has no price for
+                    logger.warning(
+                        "❌ [Positions Async] Missing ticker for %s (%s)",
+                        crypto,
+                        symbol,
                     )
-                    symbol = f"{base_currency}/USD"
+                    continue
 
-                    # Skapa en task för att hämta ticker-data
-                    ticker_tasks[crypto] = loop.run_in_executor(
-                        None, lambda s=symbol: async_exchange_instance.fetch_ticker(s)
+                # Hämta position-typ asynkront, en gång per symbol
+                position_type = position_types.get(symbol)
+                if position_type is None:
+                    position_type = position_types[symbol] = (
+                        await get_position_type_from_metadata_async(symbol)
                     )
 
-            # Vänta på att alla ticker-tasks ska slutföras
-            for crypto, future in ticker_tasks.items():
-                try:
-                    ticker = await future
-                    amount = balances[crypto]
-                    current_price = ticker["last"]
-                    current_value = amount * current_price
-
-                    # Hämta position-typ asynkront
-                    base_currency = (
-                        crypto.replace("TEST", "")
-                        if crypto.startswith("TEST")
-                        else crypto
-                    )
-                    symbol = f"{base_currency}/USD"
-                    position_type = await get_position_type_from_metadata_async(symbol)
-
-                    if position_type == "margin":
-                        # Create margin-classified position
-                        margin_position = {
-                            "id": f"margin_{crypto}_{int(time.time())}",
-                            "symbol": symbol,
-                            "side": "buy",  # Holdings are always long
-                            "amount": amount,
-                            "entry_price": current_price,
-                            "mark_price": current_price,
-                            "pnl": 0.0,  # Would need historical entry data
-                            "pnl_percentage": 0.0,
-                            "timestamp": int(time.time() * 1000),
-                            "contracts": amount,
-                            "notional": current_value,
-                            "collateral": current_value,
-                            "margin_mode": "cross",
-                            "maintenance_margin": current_value * 0.1,  # 10%
-                            "position_type": "margin",  # From margin trading
-                            "leverage": 1.0,  # Conservative estimate
-                        }
-                        margin_positions_from_holdings.append(margin_position)
-                        logging.info(
-                            f"📊 [Positions Async] Created MARGIN position: "
-                            f"{crypto} = {amount:.6f} @ ${current_price:,.2f}"
-                        )
-                    else:
-                        # Create spot position from crypto holding
-                        spot_position = {
-                            "id": f"spot_{crypto}_{int(time.time())}",
-                            "symbol": symbol,
-                            "side": "buy",  # Spot holdings are always long
-                            "amount": amount,
-                            "entry_price": current_price,
-                            "mark_price": current_price,
-                            "pnl": 0.0,  # Spot positions show no P&L
-                            "pnl_percentage": 0.0,
-                            "timestamp": int(time.time() * 1000),
-                            "contracts": amount,
-                            "notional": current_value,
-                            "collateral": current_value,
-                            "margin_mode": "spot",
-                            "maintenance_margin": 0.0,
-                            "position_type": position_type,  # From meta
-                            "leverage": 1.0,  # Spot is always 1:1
-                        }
-                        spot_positions.append(spot_position)
-                        logging.info(
-                            f"📊 [Positions Async] Created SPOT position: "
-                            f"{crypto} = {amount:.6f} @ ${current_price:,.2f}"
-                        )
-                except Exception as e:
-                    logging.warning(
-                        f"❌ [Positions Async] Failed to process position for {crypto}: {e}"
+                position = _build_position(
+                    crypto, symbol, amount, current_price, position_type, now_s, now_ms
+                )
+                if position_type == "margin":
+                    margin_positions_from_holdings.append(position)
+                    kind = "MARGIN"
+                else:
+                    spot_positions.append(position)
+                    kind = "SPOT"
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        f"📊 [Positions Async] Created {kind} position: "
+                        f"{crypto} = {amount:.6f} @ ${current_price:,.2f}"
                     )
 
         except Exception as e:
-            logging.error(f"❌ [Positions Async] Failed to create positions: {e}")
-
-        # STEP 3: Combine all position types
-        all_positions = (
-            traditional_positions + margin_positions_from_holdings + spot_positions
-        )
-
-        # STEP 4: Filter by symbols if requested
-        if symbols and all_positions:
-            filtered_positions = []
-            for position in all_positions:
-                if position["symbol"] in symbols:
-                    filtered_positions.append(position)
-            all_positions = filtered_positions
-
-        logging.info(
-            f"✅ [Positions Async] Total: {len(all_positions)} positions "
-            f"(True Margin: {len(traditional_positions)}, "
-            f"Classified Margin: {len(margin_positions_from_holdings)}, "
-            f"Spot: {len(spot_positions)})"
+            logger.error("❌ [Positions Async] Failed to create positions: %s", e)
+
+        # STEP 3: Filter by symbols if requested. Holdings were already
+        # limited to the requested symbols, so only margin positions need it.
+        if symbol_set and traditional_positions:
+            traditional_positions = [
+                position
+                for position in traditional_positions
+                if position["symbol"] in symbol_set
+            ]
+
+        # STEP 4: Combine all position types into one list
+        all_positions = [
+            *traditional_positions,
+            *margin_positions_from_holdings,
+            *spot_positions,
+        ]
+
+        logger.info(
+            "✅ [Positions Async] Total: %d positions "
+            "(True Margin: %d, Classified Margin: %d, Spot: %d)",
+            len(all_positions),
+            len(traditional_positions),
+            len(margin_positions_from_holdings),
+            len(spot_positions),
         )
 
-        # Cache the result for 20 seconds to reduce API calls
-        cache.set(cache_key, all_positions)
+        # Cache the result to reduce API calls; it is served fresh for the
+        # TTL and stale while being refreshed for the rest of the window
+        result = (all_positions, dumps({"positions": all_positions}))
+        cache.set(cache_key, result, ttl_seconds=_POSITIONS_STALE_SECONDS)
+        _fetched_at[cache_key] = time.monotonic()
+        _fetched_at.move_to_end(cache_key)
+        while len(_fetched_at) > _MAX_CACHED_KEYS:
+            evicted_key, _ = _fetched_at.popitem(last=False)
+            cache.delete(evicted_key)
 
-        return all_positions
+        return result
 
     except ExchangeError as e:
-        logging.error(f"❌ [Positions Async] Exchange error: {str(e)}")
+        logger.error("❌ [Positions Async] Exchange error: %s", e)
         raise e
     except Exception as e:
-        logging.error(f"❌ [Positions Async] Failed to fetch positions: {str(e)}")
+        logger.error("❌ [Positions Async] Failed to fetch positions: %s", e)
         raise ExchangeError(f"Failed to fetch positions: {str(e)}")
 
 
-async def get_mock_positions_async() -> List[Dict[str, Any]]:
+def mock_positions() -> List[Dict[str, Any]]:
     """
-    Returns mock positions for testing asynchronously.
+    Returns mock positions for testing.
     This should NOT be used in production!
     """
+    now_ms = int(time.time() * 1000)
     return [
         {
             "id": "BTC-PERP-12345",
@@ -237,7 +427,7 @@ async def get_mock_positions_async() -> List[Dict[str, Any]]:
             "mark_price": 47500.0,
             "pnl": 1250.0,
             "pnl_percentage": 5.56,
-            "timestamp": int(time.time() * 1000),
+            "timestamp": now_ms,
             "contracts": 0.5,
             "notional": 23750.0,
             "collateral": 23750.0,
@@ -255,7 +445,7 @@ async def get_mock_positions_async() -> List[Dict[str, Any]]:
             "mark_price": 3250.0,
             "pnl": 625.0,
             "pnl_percentage": 7.14,
-            "timestamp": int(time.time() * 1000),
+            "timestamp": now_ms,
             "contracts": 2.5,
             "notional": 8125.0,
             "collateral": 8125.0,
@@ -265,3 +455,11 @@ async def get_mock_positions_async() -> List[Dict[str, Any]]:
             "leverage": 1.0,
         },
     ]
+
+
+async def get_mock_positions_async() -> List[Dict[str, Any]]:
+    """
+    Returns mock positions for testing asynchronously.
+    This should NOT be used in production!
+    """
+    return mock_positions()
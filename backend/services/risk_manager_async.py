@@ -6,7 +6,7 @@ import logging
 import os
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -141,7 +141,15 @@ class RiskManagerAsync:
         """
         # Check for new day first
         await self._check_new_day()
+        return self._check_order_limits(order_data, portfolio_value, current_positions)
 
+    def _check_order_limits(
+        self,
+        order_data: Dict[str, Any],
+        portfolio_value: float,
+        current_positions: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Apply the basic risk limits to an order; expects the day to be current."""
         errors = []
 
         # Check position size
@@ -193,11 +201,63 @@ class RiskManagerAsync:
         Returns:
             Dict containing validation result, errors, and risk assessment
         """
+        await self._check_new_day()
+        return self._check_order_with_probabilities(
+            order_data, portfolio_value, current_positions, probability_data
+        )
+
+    async def validate_orders_batch(
+        self,
+        orders: List[Dict[str, Any]],
+        portfolio_value: float,
+        current_positions: Dict[str, Dict[str, Any]],
+        probability_datas: List[Optional[ProbabilityData]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate several orders against the same portfolio state asynchronously.
+
+        Equivalent to calling validate_order_with_probabilities per order, but
+        the day rollover check runs once for the whole batch.
+
+        Args:
+            orders: Order data dictionaries
+            portfolio_value: Current portfolio value
+            current_positions: Current open positions
+            probability_datas: Strategy probability data, one entry per order
+
+        Returns:
+            List of validation results in the same order as orders
+
+        Raises:
+            ValueError: If orders and probability_datas differ in length
+        """
+        if len(orders) != len(probability_datas):
+            raise ValueError(
+                f"Got {len(orders)} orders but {len(probability_datas)} "
+                "probability entries"
+            )
+
+        await self._check_new_day()
+        return [
+            self._check_order_with_probabilities(
+                order_data, portfolio_value, current_positions, probability_data
+            )
+            for order_data, probability_data in zip(orders, probability_datas)
+        ]
+
+    def _check_order_with_probabilities(
+        self,
+        order_data: Dict[str, Any],
+        portfolio_value: float,
+        current_positions: Dict[str, Dict[str, Any]],
+        probability_data: Optional[ProbabilityData],
+    ) -> Dict[str, Any]:
+        """Probability-aware order validation; expects the day to be current."""
         # Start with basic validation
-        basic_validation = await self.validate_order(
+        basic_validation = self._check_order_limits(
             order_data, portfolio_value, current_positions
         )
-        errors = basic_validation["errors"].copy()
+        errors = basic_validation["errors"]
         risk_score = 0.5  # Default risk score
 
         # Add probability-based validation if available
@@ -0,0 +1,78 @@
+"""
+JSON serialization helpers for API boundaries.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise, so callers get the same bytes-in/bytes-out API.
+"""
+
+import dataclasses
+import datetime
+import enum
+import json
+import uuid
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Handle missing orjson in minimal environments
+
+
+def _default(obj: Any) -> Any:
+    """Convert the non-JSON types orjson handles natively, the same way."""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes.
+
+    Args:
+        obj: JSON-compatible object (dicts, lists, datetimes, numpy scalars)
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+
+    Raises:
+        TypeError: If the object contains a type neither backend supports
+        ValueError: If the json fallback meets NaN or infinity, which it
+            refuses rather than emit invalid JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        obj,
+        default=_default,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+    ).encode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Any: Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -9,6 +9,7 @@ Handles conversion between UI format and Bitfinex API format for:
 """
 
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Tuple
 
 logger = logging.getLogger(__name__)
@@ -134,10 +135,14 @@ class BitfinexSymbolConverter:
         return "TEST" in clean_symbol.upper()
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def convert_for_api_call(symbol: str, operation: str = "trading") -> str:
         """
         Convert symbol for specific API operation.
 
+        Results are memoized since every exchange call converts one of a
+        small, fixed set of symbols.
+
         Args:
             symbol: UI format symbol
             operation: 'trading', 'market_data', 'websocket', 'funding'
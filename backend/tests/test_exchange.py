@@ -0,0 +1,78 @@
+"""Tester för orderhistorik i ExchangeService."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services.exchange import ExchangeError, ExchangeService
+
+
+def _order(order_id, symbol, timestamp):
+    """Stängd order i ccxt-format."""
+    return {
+        "id": order_id,
+        "symbol": symbol,
+        "timestamp": timestamp,
+        "fee": {"cost": 0.1},
+    }
+
+
+@pytest.fixture
+def bitfinex_service():
+    """ExchangeService med en mockad Bitfinex-klient."""
+    service = object.__new__(ExchangeService)
+    service.exchange = MagicMock()
+    service.exchange.id = "bitfinex"
+    service.exchange.fetch_closed_orders.return_value = [
+        _order("1", "BTC/USD", 1000),
+        _order("2", "XRP/USD", 2000),
+        _order("3", "ETH/USD", 3000),
+    ]
+    return service
+
+
+def test_order_history_fetches_all_symbols_in_one_request(bitfinex_service):
+    """Test att alla symboler hämtas i ett anrop och filtreras lokalt."""
+    orders = bitfinex_service.fetch_order_history(
+        ["BTC/USD", "ETH/USD"], since=500, limit=10
+    )
+
+    bitfinex_service.exchange.fetch_closed_orders.assert_called_once_with(
+        None, 500, 20, {"type": "exchange"}
+    )
+    assert [order["id"] for order in orders] == ["3", "1"]
+
+
+def test_order_history_limit_counts_each_symbol_once(bitfinex_service):
+    """Test att dubbletter i symbollistan inte höjer gränsen."""
+    bitfinex_service.fetch_order_history(["BTC/USD", "BTC/USD"], limit=10)
+
+    args = bitfinex_service.exchange.fetch_closed_orders.call_args.args
+    assert args[2] == 10
+
+
+def test_order_history_fails_for_all_symbols_together(bitfinex_service):
+    """Test att ett misslyckat anrop ger fel för alla symboler."""
+    bitfinex_service.exchange.fetch_closed_orders.side_effect = Exception("down")
+
+    with pytest.raises(ExchangeError):
+        bitfinex_service.fetch_order_history(["BTC/USD", "ETH/USD"])
+
+
+def test_order_history_caps_orders_per_symbol(bitfinex_service):
+    """Test att en aktiv symbol inte får fler än limit ordrar."""
+    bitfinex_service.exchange.fetch_closed_orders.return_value = [
+        *(_order(f"btc-{i}", "BTC/USD", 1000 + i) for i in range(5)),
+        _order("eth-0", "ETH/USD", 500),
+    ]
+
+    orders = bitfinex_service.fetch_order_history(["BTC/USD", "ETH/USD"], limit=2)
+
+    assert [order["id"] for order in orders] == ["btc-4", "btc-3", "eth-0"]
+
+
+def test_order_history_normalizes_requested_symbols(bitfinex_service):
+    """Test att symboler i Bitfinex-format matchar ccxt:s enhetliga symboler."""
+    orders = bitfinex_service.fetch_order_history(["tBTC:USD"], limit=10)
+
+    assert [order["id"] for order in orders] == ["1"]
@@ -0,0 +1,199 @@
+"""Tester för tickerhämtning i exchange_async."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+import backend.services.exchange_async as exchange_async
+from backend.services.exchange import ExchangeError
+
+
+@pytest.fixture
+def bitfinex_exchange(monkeypatch):
+    """Mockad Bitfinex-exchange med laddade marknader."""
+    exchange = MagicMock()
+    exchange.exchange.id = "bitfinex"
+    exchange.exchange.markets = {
+        "BTC/USD": {"id": "tBTCUSD"},
+        "ETH/USD": {"id": "tETHUSD"},
+    }
+    exchange.fetch_tickers.return_value = {
+        "BTC/USD": {"symbol": "BTC/USD", "last": 39000.0},
+    }
+    monkeypatch.setattr(exchange_async, "_ticker_cache", {})
+    monkeypatch.setattr(
+        exchange_async, "_ticker_breaker", exchange_async._CircuitBreaker(3, 30.0)
+    )
+    return exchange
+
+
+def _use_transport(monkeypatch, handler):
+    """Ersätt den delade HTTP-klienten med en mockad transport."""
+    client = httpx.AsyncClient(
+        base_url=exchange_async._BITFINEX_PUBLIC_URL,
+        transport=httpx.MockTransport(handler),
+    )
+    monkeypatch.setitem(
+        exchange_async._http_clients, asyncio.get_running_loop(), client
+    )
+
+
+async def test_fetch_tickers_uses_raw_bitfinex_endpoint(bitfinex_exchange, monkeypatch):
+    """Test att priser hämtas direkt från /v2/tickers utan ccxt."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json=[
+                ["tBTCUSD", 39990, 1, 40010, 1, 0, 0, 40000, 12.5, 0, 0],
+                ["tETHUSD", 1999, 1, 2001, 1, 0, 0, 2000, 80, 0, 0],
+            ],
+        )
+
+    _use_transport(monkeypatch, handler)
+
+    tickers = await exchange_async.fetch_tickers_async(
+        bitfinex_exchange, ["BTC/USD", "ETH/USD"]
+    )
+
+    assert len(requests) == 1
+    assert requests[0].url.path == "/v2/tickers"
+    assert requests[0].url.params["symbols"] == "tBTCUSD,tETHUSD"
+    assert tickers["BTC/USD"]["last"] == 40000.0
+    assert tickers["BTC/USD"]["bid"] == 39990.0
+    assert tickers["ETH/USD"]["volume"] == 80.0
+    bitfinex_exchange.fetch_tickers.assert_not_called()
+
+
+async def test_fetch_tickers_falls_back_to_ccxt_on_http_error(
+    bitfinex_exchange, monkeypatch
+):
+    """Test att ccxt används när det råa anropet misslyckas."""
+    _use_transport(monkeypatch, lambda request: httpx.Response(500))
+
+    tickers = await exchange_async.fetch_tickers_async(bitfinex_exchange, ["BTC/USD"])
+
+    bitfinex_exchange.fetch_tickers.assert_called_once_with(["BTC/USD"])
+    assert tickers["BTC/USD"]["last"] == 39000.0
+
+
+async def test_fetch_tickers_uses_ccxt_before_markets_are_loaded(
+    bitfinex_exchange, monkeypatch
+):
+    """Test att ccxt används tills marknaderna är laddade."""
+    bitfinex_exchange.exchange.markets = None
+    _use_transport(monkeypatch, lambda request: pytest.fail("raw request sent"))
+
+    await exchange_async.fetch_tickers_async(bitfinex_exchange, ["BTC/USD"])
+
+    bitfinex_exchange.fetch_tickers.assert_called_once_with(["BTC/USD"])
+
+
+async def test_fetch_tickers_serves_last_known_price_on_failure(bitfinex_exchange):
+    """Test att senast kända pris används när hämtningen misslyckas."""
+    bitfinex_exchange.exchange.markets = None
+    bitfinex_exchange.fetch_tickers.side_effect = ExchangeError("down")
+    exchange_async._ticker_cache["BTC/USD"] = (
+        time.monotonic() - 10.0,
+        {"last": 38000.0},
+    )
+
+    tickers = await exchange_async.fetch_tickers_async(bitfinex_exchange, ["BTC/USD"])
+
+    assert tickers["BTC/USD"]["last"] == 38000.0
+
+
+async def test_fetch_tickers_times_out_slow_requests(bitfinex_exchange, monkeypatch):
+    """Test att långsamma anrop avbryts och gamla priser används."""
+    monkeypatch.setattr(exchange_async, "_TICKER_TIMEOUT_SECONDS", 0.05)
+    bitfinex_exchange.exchange.markets = None
+    bitfinex_exchange.fetch_tickers.side_effect = lambda symbols: time.sleep(0.5)
+    exchange_async._ticker_cache["BTC/USD"] = (
+        time.monotonic() - 10.0,
+        {"last": 38000.0},
+    )
+
+    started = time.monotonic()
+    tickers = await exchange_async.fetch_tickers_async(bitfinex_exchange, ["BTC/USD"])
+
+    assert time.monotonic() - started < 0.4
+    assert tickers["BTC/USD"]["last"] == 38000.0
+
+
+async def test_fetch_tickers_breaker_opens_after_repeated_failures(
+    bitfinex_exchange,
+):
+    """Test att anrop pausas efter upprepade fel."""
+    bitfinex_exchange.exchange.markets = None
+    bitfinex_exchange.fetch_tickers.side_effect = ExchangeError("down")
+
+    for _ in range(4):
+        with pytest.raises(ExchangeError):
+            await exchange_async.fetch_tickers_async(bitfinex_exchange, ["BTC/USD"])
+
+    assert bitfinex_exchange.fetch_tickers.call_count == 3
+
+
+async def test_fetch_tickers_rejects_prices_past_max_staleness(bitfinex_exchange):
+    """Test att för gamla priser inte används som reserv."""
+    bitfinex_exchange.exchange.markets = None
+    bitfinex_exchange.fetch_tickers.side_effect = ExchangeError("down")
+    exchange_async._ticker_cache["BTC/USD"] = (
+        time.monotonic() - exchange_async._TICKER_MAX_STALE_SECONDS - 1.0,
+        {"last": 38000.0},
+    )
+
+    with pytest.raises(ExchangeError):
+        await exchange_async.fetch_tickers_async(bitfinex_exchange, ["BTC/USD"])
+
+
+def test_half_open_breaker_admits_one_probe_at_a_time(monkeypatch):
+    """Test att bara ett provanrop släpps igenom när brytaren är halvöppen."""
+    now = [100.0]
+    monkeypatch.setattr(exchange_async.time, "monotonic", lambda: now[0])
+    breaker = exchange_async._CircuitBreaker(threshold=1, reset_seconds=30.0)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now[0] += 30.0
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now[0] += 30.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+
+
+def test_half_open_breaker_replaces_lost_probe(monkeypatch):
+    """Test att ett provanrop som aldrig rapporterar ersätts efter en period."""
+    now = [100.0]
+    monkeypatch.setattr(exchange_async.time, "monotonic", lambda: now[0])
+    breaker = exchange_async._CircuitBreaker(threshold=1, reset_seconds=30.0)
+    breaker.record_failure()
+
+    now[0] += 30.0
+    assert breaker.allow()
+    now[0] += 30.0
+    assert breaker.allow()
+
+
+def test_mock_order_book_is_not_shared_between_calls():
+    """Test att ändringar i mockens orderbok inte läcker till nästa anrop."""
+    exchange = exchange_async.create_mock_exchange_service()
+
+    book = exchange.fetch_order_book("BTC/USD")
+    book["bids"] = ()
+
+    assert exchange.fetch_order_book("BTC/USD")["bids"] == (
+        (35000.0, 1.5),
+        (34900.0, 2.3),
+    )
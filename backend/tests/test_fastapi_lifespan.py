@@ -0,0 +1,29 @@
+"""Tester för uppstart och nedstängning i FastAPI-appens lifespan."""
+
+import logging
+from logging.handlers import QueueHandler
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.fastapi_app import app, lifespan
+
+
+async def test_lifespan_releases_logging_and_http_client_on_failure(monkeypatch):
+    """Test att loggtråd och HTTP-klient städas även när uppstarten fallerar."""
+    monkeypatch.setenv("FASTAPI_DISABLE_WEBSOCKETS", "true")
+    handlers = list(logging.getLogger().handlers)
+    close_client = AsyncMock()
+
+    with patch(
+        "backend.services.bot_manager_async.get_bot_manager_async",
+        AsyncMock(side_effect=RuntimeError("boom")),
+    ), patch("backend.fastapi_app.close_http_client_async", close_client):
+        with pytest.raises(RuntimeError):
+            async with lifespan(app):
+                pass
+
+    close_client.assert_awaited_once()
+    root_handlers = logging.getLogger().handlers
+    assert not any(isinstance(h, QueueHandler) for h in root_handlers)
+    assert root_handlers == handlers
@@ -109,6 +109,27 @@ def test_get_orders_with_symbol_filter(client, mock_order_service):
     mock_order_service.get_open_orders.assert_called_once_with("BTC/USD")
 
 
+@pytest.mark.fast
+@pytest.mark.api
+def test_get_orders_with_multiple_symbols(client, mock_order_service):
+    """Test GET /api/orders with a comma-separated symbols batch."""
+    mock_order_service.get_open_orders_multi.return_value = {
+        "BTC/USD": [{"id": "123", "symbol": "BTC/USD", "status": "open"}],
+        "ETH/USD": [{"id": "124", "symbol": "ETH/USD", "status": "open"}],
+    }
+
+    response = client.get("/api/orders?symbols=BTC/USD,ETH/USD")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [order["id"] for order in data["orders"]] == ["123", "124"]
+
+    mock_order_service.get_open_orders_multi.assert_called_once_with(
+        ["BTC/USD", "ETH/USD"]
+    )
+    mock_order_service.get_open_orders.assert_not_called()
+
+
 def test_get_order_by_id_success(client, mock_order_service):
     """Test successful GET /api/orders/{order_id}."""
     mock_order = {
@@ -284,6 +305,19 @@ def test_cancel_order_success(client, mock_order_service):
     mock_order_service.cancel_order.assert_called_once_with("123")
 
 
+@pytest.mark.fast
+@pytest.mark.api
+def test_cancel_orders_bulk(client, mock_order_service):
+    """Test POST /api/orders/cancel for bulk cancellation."""
+    mock_order_service.cancel_orders.return_value = {"123": True, "124": False}
+
+    response = client.post("/api/orders/cancel", json={"order_ids": ["123", "124"]})
+
+    assert response.status_code == 200
+    assert response.json() == {"results": {"123": True, "124": False}}
+    mock_order_service.cancel_orders.assert_called_once_with(["123", "124"])
+
+
 def test_cancel_order_not_found(client, mock_order_service):
     """Test DELETE /api/orders/{order_id} when order not found."""
     mock_order_service.cancel_order.return_value = False
@@ -6,9 +6,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
-from backend.api.dependencies import get_positions_service_async
+from backend.api.dependencies import get_positions_payload_service_async
+from backend.api.models import PositionsResponse
 from backend.fastapi_app import app
 from backend.services.exchange import ExchangeError
+from backend.services.serialization import dumps
 
 client = TestClient(app)
 
@@ -65,8 +67,13 @@ def mock_positions_service():
             },
         ]
 
-    with patch("backend.api.dependencies.get_positions_service_async") as mock:
-        mock.return_value = mock_fetch_positions_async
+    async def mock_fetch_positions_payload_async(symbols=None):
+        """Mock fetch_positions_payload_async function."""
+        positions = await mock_fetch_positions_async(symbols)
+        return positions, dumps({"positions": positions})
+
+    with patch("backend.api.dependencies.get_positions_payload_service_async") as mock:
+        mock.return_value = mock_fetch_positions_payload_async
         yield mock
 
 
@@ -93,7 +100,7 @@ def test_get_positions(
     mock_positions_service, mock_event_logger, mock_should_suppress_routine_log
 ):
     """Test get_positions endpoint."""
-    app.dependency_overrides[get_positions_service_async] = (
+    app.dependency_overrides[get_positions_payload_service_async] = (
         lambda: mock_positions_service.return_value
     )
     response = client.get("/api/positions")
@@ -109,7 +116,7 @@ def test_get_positions(
 
 def test_get_positions_with_symbols(mock_positions_service, mock_event_logger):
     """Test get_positions endpoint with symbols parameter."""
-    app.dependency_overrides[get_positions_service_async] = (
+    app.dependency_overrides[get_positions_payload_service_async] = (
         lambda: mock_positions_service.return_value
     )
     response = client.get("/api/positions?symbols=BTC/USD&symbols=ETH/USD")
@@ -124,7 +131,7 @@ def test_get_positions_suppress_log(
     mock_positions_service, mock_event_logger, mock_should_suppress_routine_log
 ):
     """Test get_positions endpoint med log suppression."""
-    app.dependency_overrides[get_positions_service_async] = (
+    app.dependency_overrides[get_positions_payload_service_async] = (
         lambda: mock_positions_service.return_value
     )
     mock_should_suppress_routine_log.return_value = True
@@ -148,3 +155,51 @@ def test_get_positions_general_exception(mock_event_logger):
         "TODO: Kan ej testas korrekt med FastAPI dependency override – symbol-parametrar når inte mocken. Se diskussion i kodbasen."
     )
     # Se tidigare försök och reflektioner för detaljer.
+
+
+def test_get_positions_validates_payload(mock_event_logger):
+    """Test att positioner som bryter mot PositionsResponse ger 500."""
+    invalid = [{"id": None, "symbol": "BTC/USD"}]
+
+    async def fetch_invalid_payload(symbols=None):
+        return invalid, dumps({"positions": invalid})
+
+    app.dependency_overrides[get_positions_payload_service_async] = (
+        lambda: fetch_invalid_payload
+    )
+    try:
+        response = client.get("/api/positions")
+    finally:
+        app.dependency_overrides = {}
+
+    assert response.status_code == 500
+
+
+def test_get_positions_validates_cached_body_once(
+    mock_positions_service, mock_event_logger
+):
+    """Test att samma cachade body bara valideras en gång."""
+    payload = None
+
+    async def fetch_cached_payload(symbols=None):
+        nonlocal payload
+        if payload is None:
+            payload = await mock_positions_service.return_value(symbols)
+        return payload
+
+    app.dependency_overrides[get_positions_payload_service_async] = (
+        lambda: fetch_cached_payload
+    )
+    try:
+        with patch(
+            "backend.api.positions.PositionsResponse.model_validate",
+            wraps=PositionsResponse.model_validate,
+        ) as validate:
+            first = client.get("/api/positions")
+            second = client.get("/api/positions")
+    finally:
+        app.dependency_overrides = {}
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    validate.assert_called_once()
@@ -0,0 +1,87 @@
+"""Tester för nonce-generering och kö-processorn i GlobalNonceManager."""
+
+import threading
+import time
+
+import pytest
+
+import backend.services.global_nonce_manager as nonce_module
+from backend.services.global_nonce_manager import EnhancedGlobalNonceManager
+
+
+@pytest.fixture
+def make_manager(monkeypatch):
+    """Skapa fristående managers utanför singletonen och stäng dem efteråt."""
+    managers = []
+
+    def factory(dev_mode: bool = False) -> EnhancedGlobalNonceManager:
+        monkeypatch.setenv("DISABLE_NONCE_MANAGER", "true" if dev_mode else "false")
+        manager = object.__new__(EnhancedGlobalNonceManager)
+        manager.__init__()
+        # Rate limiting per nyckel testas inte här
+        manager._min_request_interval = 0.0
+        managers.append(manager)
+        return manager
+
+    yield factory
+    for manager in managers:
+        manager.shutdown()
+
+
+def _concurrent_nonces(manager, threads: int = 8, calls: int = 25):
+    """Hämta nonces från flera trådar samtidigt, en lista per tråd."""
+    results = [[] for _ in range(threads)]
+    start = threading.Barrier(threads)
+
+    def worker(index):
+        start.wait()
+        for _ in range(calls):
+            results[index].append(manager.get_next_nonce(f"key-{index}", "test"))
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join(timeout=10)
+    return results
+
+
+@pytest.mark.parametrize("dev_mode", [False, True])
+def test_concurrent_nonces_are_unique_and_increasing(make_manager, dev_mode):
+    """Test att samtidiga anrop ger unika, strikt växande nonces."""
+    manager = make_manager(dev_mode=dev_mode)
+
+    results = _concurrent_nonces(manager)
+
+    all_nonces = [nonce for per_thread in results for nonce in per_thread]
+    assert len(all_nonces) == 8 * 25
+    assert len(set(all_nonces)) == len(all_nonces)
+    for per_thread in results:
+        assert all(a < b for a, b in zip(per_thread, per_thread[1:]))
+
+
+def test_nonces_increase_when_clock_stands_still(make_manager, monkeypatch):
+    """Test att nonces växer även inom samma millisekund."""
+    manager = make_manager(dev_mode=True)
+    frozen = manager._last_nonce
+    monkeypatch.setattr(nonce_module, "_now_ms", lambda: frozen)
+
+    nonces = [manager.get_next_nonce("key", "test") for _ in range(5)]
+
+    assert nonces == list(range(frozen + 1, frozen + 6))
+
+
+def test_shutdown_wakes_and_joins_idle_processor(make_manager):
+    """Test att shutdown väcker den väntande kö-processorn direkt."""
+    manager = make_manager()
+    thread = manager._queue_processor_thread
+    assert thread is not None and thread.is_alive()
+    # Låt processorn hinna somna på villkorsvariabeln
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    manager.shutdown()
+
+    # Utan notify skulle processorn sova kvar upp till 0.5 s
+    assert time.monotonic() - started < 0.4
+    assert not thread.is_alive()
@@ -6,6 +6,7 @@ med korrekt hantering av asynkrona funktioner och mockade dependencies.
 """
 
 import asyncio
+import time
 import uuid
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -13,6 +14,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from backend.services.exchange import ExchangeService
+from backend.services.order_service import generate_order_id
 from backend.services.order_service_async import OrderServiceAsync
 
 
@@ -65,6 +67,17 @@ def order_service_async(mock_exchange_service):
 # === Tester för OrderServiceAsync ===
 
 
+def test_generate_order_id_is_time_ordered():
+    """Test att order-ID:n är UUIDv7 och sorteras i skapandeordning."""
+    first = generate_order_id()
+    time_ordered = [generate_order_id() for _ in range(5)]
+
+    assert uuid.UUID(first).version == 7
+    assert uuid.UUID(first).variant == uuid.RFC_4122
+    # De första 48 bitarna är en millisekund-tidsstämpel
+    assert all(order_id[:8] >= first[:8] for order_id in time_ordered)
+
+
 @pytest.mark.asyncio
 async def test_place_order(order_service_async, mock_exchange_service):
     """Test för att placera en order."""
@@ -179,6 +192,43 @@ async def test_get_order_status(order_service_async, mock_exchange_service):
         assert kwargs["symbol"] == "BTC/USD"
 
 
+@pytest.mark.asyncio
+async def test_get_order_status_skips_recent_and_terminal_orders(
+    order_service_async,
+):
+    """Test att orderstatus inte hämtas om i onödan från exchange."""
+    order_service_async.orders["order-1"] = {
+        "id": "order-1",
+        "exchange_order_id": "1",
+        "symbol": "BTC/USD",
+        "status": "open",
+    }
+
+    with patch(
+        "backend.services.order_service_async.fetch_order_async"
+    ) as mock_fetch_order:
+        mock_fetch_order.return_value = {
+            "status": "closed",
+            "filled": 1.0,
+            "remaining": 0.0,
+        }
+
+        # Första anropet hämtar från exchange, ordern blir då stängd
+        first = await order_service_async.get_order_status("order-1")
+        assert first["status"] == "closed"
+
+        # Stängd order ska aldrig hämtas igen och glöms i pollningstabellen
+        assert "order-1" not in order_service_async._last_fetched_at
+        await order_service_async.get_order_status("order-1")
+
+        # Öppen order inom poll_ttl ska inte heller hämtas igen
+        order_service_async.orders["order-1"]["status"] = "open"
+        order_service_async._last_fetched_at["order-1"] = time.monotonic()
+        await order_service_async.get_order_status("order-1")
+
+        mock_fetch_order.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_get_order_status_not_found(order_service_async):
     """Test för att hämta orderstatus för en order som inte finns."""
@@ -245,6 +295,41 @@ async def test_cancel_order(order_service_async, mock_exchange_service):
         assert kwargs["symbol"] == "BTC/USD"
 
 
+@pytest.mark.asyncio
+async def test_cancel_orders_bounded_concurrency(mock_exchange_service):
+    """Test att bulk-avbrytning begränsar antalet samtidiga exchange-anrop."""
+    service = OrderServiceAsync(mock_exchange_service, cancel_concurrency=2)
+    for i in range(5):
+        service.orders[f"order-{i}"] = {
+            "id": f"order-{i}",
+            "exchange_order_id": str(i),
+            "symbol": "BTC/USD",
+            "status": "open",
+        }
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def cancel_side_effect(exchange, order_id, symbol):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True
+
+    with patch(
+        "backend.services.order_service_async.cancel_order_async",
+        side_effect=cancel_side_effect,
+    ):
+        results = await service.cancel_orders(
+            [f"order-{i}" for i in range(5)] + ["missing"]
+        )
+
+    assert results == {**{f"order-{i}": True for i in range(5)}, "missing": False}
+    assert max_in_flight == 2
+
+
 @pytest.mark.asyncio
 async def test_cancel_order_not_found(order_service_async):
     """Test för att avbryta en order som inte finns."""
@@ -363,6 +448,68 @@ async def test_get_open_orders(order_service_async, mock_exchange_service):
             )
 
 
+@pytest.mark.asyncio
+async def test_get_open_orders_multi(order_service_async, mock_exchange_service):
+    """Test för att hämta öppna ordrar för flera symboler samtidigt."""
+    # Arrange
+    order_service_async.orders = {}
+    exchange_orders = {
+        "BTC/USD": [
+            {
+                "id": "btc-1",
+                "symbol": "BTC/USD",
+                "type": "limit",
+                "side": "buy",
+                "amount": 1.0,
+                "price": 50000.0,
+                "status": "open",
+                "filled": 0.0,
+                "remaining": 1.0,
+            }
+        ],
+        "ETH/USD": [],
+    }
+
+    async def fetch_side_effect(exchange, symbol):
+        if symbol == "LTC/USD":
+            raise Exception("Exchange error")
+        return exchange_orders[symbol]
+
+    with patch(
+        "backend.services.order_service_async.fetch_open_orders_async",
+        side_effect=fetch_side_effect,
+    ) as mock_fetch_open_orders:
+        # Act
+        result = await order_service_async.get_open_orders_multi(
+            ["BTC/USD", "ETH/USD", "LTC/USD"]
+        )
+
+        # Assert
+        assert set(result) == {"BTC/USD", "ETH/USD", "LTC/USD"}
+        assert len(result["BTC/USD"]) == 1
+        assert result["BTC/USD"][0]["exchange_order_id"] == "btc-1"
+        assert result["ETH/USD"] == []
+        assert result["LTC/USD"] == []
+        assert mock_fetch_open_orders.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_open_orders_multi_skips_cancelled_fetches(order_service_async):
+    """Test att avbrutna hämtningar inte slås ihop som orderlistor."""
+    order_service_async.orders = {}
+
+    async def fetch_side_effect(exchange, symbol):
+        raise asyncio.CancelledError()
+
+    with patch(
+        "backend.services.order_service_async.fetch_open_orders_async",
+        side_effect=fetch_side_effect,
+    ):
+        result = await order_service_async.get_open_orders_multi(["BTC/USD"])
+
+    assert result == {"BTC/USD": []}
+
+
 @pytest.mark.asyncio
 async def test_place_order_validation_error(order_service_async):
     """Test för att placera en order med ogiltiga data."""
@@ -386,6 +533,39 @@ async def test_place_order_validation_error(order_service_async):
             await order_service_async.place_order(invalid_order_data)
 
 
+@pytest.mark.asyncio
+async def test_place_order_validates_while_markets_preload(order_service_async):
+    """Test att valideringen körs medan marknaderna förladdas."""
+    preload_started = asyncio.Event()
+    preload_cancelled = False
+
+    async def slow_preload(exchange):
+        nonlocal preload_cancelled
+        preload_started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            preload_cancelled = True
+            raise
+
+    def failing_validation(data):
+        raise RuntimeError("validation crashed")
+
+    with patch(
+        "backend.services.order_service_async.preload_markets_async",
+        side_effect=slow_preload,
+    ), patch(
+        "backend.services.order_service_async.validate_order_data",
+        side_effect=failing_validation,
+    ):
+        with pytest.raises(RuntimeError):
+            await order_service_async.place_order({"symbol": "BTC/USD"})
+        await asyncio.sleep(0)
+
+    assert preload_started.is_set()
+    assert preload_cancelled
+
+
 @pytest.mark.asyncio
 async def test_place_order_exchange_error(order_service_async):
     """Test för att hantera fel från exchange vid orderplacering."""
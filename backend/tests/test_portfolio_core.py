@@ -0,0 +1,105 @@
+"""Tester för den delade signalkombineringen i portfolio_core."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from backend.services.portfolio_core import (
+    combine_signals_core,
+    diversification_factor,
+    now_iso,
+)
+from backend.strategies.sample_strategy import TradeSignal
+
+
+def test_combine_signals_core_filters_and_combines():
+    """Test att okända, avstängda och svaga signaler filtreras bort."""
+    enabled = {"ema": (0.5, 0.5), "rsi": (0.3, 0.7)}
+    known = {"ema", "rsi", "off"}
+    signals = {
+        "ema": TradeSignal(
+            action="buy",
+            confidence=0.8,
+            metadata={
+                "probability_buy": 0.7,
+                "probability_sell": 0.1,
+                "probability_hold": 0.2,
+            },
+        ),
+        "rsi": TradeSignal(action="sell", confidence=0.6, metadata={}),
+        "off": TradeSignal(action="sell", confidence=0.9, metadata={}),
+        "unknown": TradeSignal(action="sell", confidence=0.9, metadata={}),
+    }
+
+    combination = combine_signals_core(enabled, known, signals)
+
+    assert combination.strategy_names == ["ema"]
+    assert combination.signals == [signals["ema"]]
+    assert combination.action == "buy"
+    assert combination.probabilities == pytest.approx((0.7, 0.1, 0.2))
+    assert combination.confidence == pytest.approx(0.8)
+    assert combination.total_weight == pytest.approx(0.5)
+
+
+def test_combine_signals_core_without_valid_signals():
+    """Test att None returneras när inga signaler har vikt."""
+    signals = {"unknown": TradeSignal(action="buy", confidence=0.9, metadata={})}
+
+    assert combine_signals_core({}, set(), signals) is None
+
+
+def test_combine_signals_core_warns_only_for_unknown_strategies():
+    """Test att avstängda strategier inte loggas som okända."""
+    signals = {
+        "off": TradeSignal(action="buy", confidence=0.9, metadata={}),
+        "unknown": TradeSignal(action="buy", confidence=0.9, metadata={}),
+    }
+
+    with patch("backend.services.portfolio_core.logger.warning") as mock_warn:
+        combine_signals_core({}, {"off"}, signals)
+
+    mock_warn.assert_called_once_with("Unknown strategy: %s", "unknown")
+
+
+def test_diversification_factor():
+    """Test att diversifieringsfaktorn ligger mellan 0.5 och 1.0."""
+    assert diversification_factor(0, 5) == 1.0
+    assert diversification_factor(1, 4) == pytest.approx(0.875)
+    assert diversification_factor(10, 5) == 0.5
+
+
+def test_now_iso_uses_millisecond_precision():
+    """Test att tidsstämplar är ISO-8601 med millisekunder."""
+    timestamp = now_iso()
+
+    assert isinstance(datetime.fromisoformat(timestamp), datetime)
+    assert len(timestamp.rsplit(".", 1)[1]) == 3
+
+
+def test_combine_signals_core_grows_scratch_buffers():
+    """Test att återanvända buffertar växer för större signalbatcher."""
+    small = {"s0": TradeSignal(action="buy", confidence=0.9, metadata={})}
+    assert combine_signals_core({"s0": (1.0, 0.5)}, {"s0"}, small) is not None
+
+    names = [f"s{i}" for i in range(20)]
+    enabled = {name: (1.0, 0.5) for name in names}
+    signals = {
+        name: TradeSignal(
+            action="sell",
+            confidence=0.6,
+            metadata={
+                "probability_buy": 0.1,
+                "probability_sell": 0.8,
+                "probability_hold": 0.1,
+            },
+        )
+        for name in names
+    }
+
+    combination = combine_signals_core(enabled, set(names), signals)
+
+    assert combination.strategy_names == names
+    assert combination.action == "sell"
+    assert combination.total_weight == pytest.approx(20.0)
+    assert combination.probabilities == pytest.approx((0.1, 0.8, 0.1))
@@ -0,0 +1,40 @@
+"""Tester för de numeriska kärnorna i portfolio_kernels."""
+
+import numpy as np
+import pytest
+
+from backend.services.portfolio_kernels import (
+    _combine_weighted_loop,
+    _combine_weighted_numpy,
+    combine_weighted,
+)
+
+
+@pytest.mark.parametrize(
+    "kernel", [combine_weighted, _combine_weighted_loop, _combine_weighted_numpy]
+)
+def test_combine_weighted_average(kernel):
+    """Test att viktat medelvärde och vinnande action beräknas korrekt."""
+    weights = np.array([0.5, 0.3])
+    probs = np.array([[0.7, 0.1, 0.2, 0.8], [0.3, 0.2, 0.5, 0.6]])
+
+    combined, action_index, total_weight = kernel(weights, probs)
+
+    assert total_weight == pytest.approx(0.8)
+    assert combined == pytest.approx([0.55, 0.1375, 0.3125, 0.725])
+    assert action_index == 0
+
+
+@pytest.mark.parametrize(
+    "kernel", [combine_weighted, _combine_weighted_loop, _combine_weighted_numpy]
+)
+def test_combine_weighted_edge_cases(kernel):
+    """Test tomma indata och att första action vinner vid lika sannolikhet."""
+    combined, action_index, total_weight = kernel(np.zeros(0), np.zeros((0, 4)))
+    assert total_weight == 0.0
+    assert list(combined) == [0.0, 0.0, 0.0, 0.0]
+
+    combined, action_index, _ = kernel(
+        np.array([1.0]), np.array([[0.2, 0.4, 0.4, 0.5]])
+    )
+    assert action_index == 1
@@ -142,6 +142,93 @@ class TestPortfolioManagerAsyncBasic:
             mock_warn.assert_called_once()
             assert "weights sum to" in mock_warn.call_args[0][0].lower()
 
+    @pytest.mark.asyncio
+    async def test_rebalance_refreshes_enabled_weights(self, portfolio_manager):
+        """Test att cachade vikter uppdateras efter ombalansering."""
+        portfolio_manager.strategy_weights["fvg_strategy"].enabled = False
+
+        portfolio_manager.rebalance_portfolio_weights({"ema_crossover": 1.5})
+        summary = await portfolio_manager.get_portfolio_summary({})
+
+        assert summary["active_strategies"] == ["ema_crossover", "rsi_strategy"]
+        assert portfolio_manager._sum_enabled_weight == pytest.approx(1.0)
+        assert portfolio_manager.strategy_weights[
+            "ema_crossover"
+        ].weight == pytest.approx(0.75 / 1.05)
+
+    @pytest.mark.asyncio
+    async def test_summary_tracks_directly_edited_strategy_weights(
+        self, portfolio_manager
+    ):
+        """Test att ändringar direkt på StrategyWeight-objekt syns i cachen."""
+        first = await portfolio_manager.get_portfolio_summary({})
+        assert "fvg_strategy" in first["active_strategies"]
+
+        portfolio_manager.strategy_weights["fvg_strategy"].enabled = False
+        second = await portfolio_manager.get_portfolio_summary({})
+
+        assert "fvg_strategy" not in second["active_strategies"]
+
+    @pytest.mark.asyncio
+    async def test_enabled_cache_kept_while_settings_unchanged(self, portfolio_manager):
+        """Test att cachen bara byggs om när en inställning ändras."""
+        await portfolio_manager.get_portfolio_summary({})
+        lookup = portfolio_manager._enabled_lookup
+
+        await portfolio_manager.get_portfolio_summary({})
+        assert portfolio_manager._enabled_lookup is lookup
+
+        portfolio_manager.strategy_weights["ema_crossover"].min_confidence = 0.9
+        await portfolio_manager.get_portfolio_summary({})
+        assert portfolio_manager._enabled_lookup is not lookup
+        assert portfolio_manager._enabled_lookup["ema_crossover"][1] == 0.9
+
+    @pytest.mark.asyncio
+    async def test_portfolio_status_copies_cached_strategies(self, portfolio_manager):
+        """Test att ändringar i returnerad status inte påverkar cachen."""
+        first = await portfolio_manager.get_portfolio_status()
+        first["active_strategies"]["ema_crossover"]["weight"] = 99.0
+
+        second = await portfolio_manager.get_portfolio_status()
+
+        assert second["active_strategies"]["ema_crossover"]["weight"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_portfolio_status_tracks_weight_changes(self, portfolio_manager):
+        """Test att cachade aktiva strategier följer viktändringar."""
+        first = await portfolio_manager.get_portfolio_status()
+        assert first["active_strategies"]["ema_crossover"]["weight"] == 0.5
+
+        portfolio_manager.rebalance_portfolio_weights({"ema_crossover": 1.5})
+        second = await portfolio_manager.get_portfolio_status()
+
+        assert second["active_strategies"]["ema_crossover"]["weight"] == pytest.approx(
+            0.75 / 1.25
+        )
+        assert first["active_strategies"]["ema_crossover"]["weight"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_rebalance_clamps_performance(self, portfolio_manager):
+        """Test att prestanda begränsas och okända strategier ignoreras."""
+        before = {
+            name: sw.weight for name, sw in portfolio_manager.strategy_weights.items()
+        }
+
+        portfolio_manager.rebalance_portfolio_weights(
+            {"ema_crossover": 10.0, "rsi_strategy": 0.0, "unknown": 2.0}
+        )
+
+        raw = {
+            "ema_crossover": before["ema_crossover"] * 1.5,
+            "rsi_strategy": before["rsi_strategy"] * 0.5,
+            "fvg_strategy": before["fvg_strategy"],
+        }
+        total = sum(raw.values())
+        for name, weight in raw.items():
+            assert portfolio_manager.strategy_weights[name].weight == pytest.approx(
+                weight / total
+            )
+
 
 class TestPortfolioManagerAsyncSignals:
     """Test signalbehandling i PortfolioManagerAsync."""
@@ -151,7 +238,7 @@ class TestPortfolioManagerAsyncSignals:
         self, portfolio_manager, mock_strategy_signals
     ):
         """Test att kombinera signaler från flera strategier."""
-        combined_signal = await portfolio_manager.combine_strategy_signals(
+        combined_signal = portfolio_manager.combine_strategy_signals(
             mock_strategy_signals, "BTC/USD", 50000.0
         )
 
@@ -165,10 +252,17 @@ class TestPortfolioManagerAsyncSignals:
         assert "symbol" in combined_signal.metadata
         assert combined_signal.metadata["symbol"] == "BTC/USD"
 
+    def test_combined_signal_is_immutable(self, portfolio_manager):
+        """Test att CombinedSignal inte kan ändras efter att den skapats."""
+        hold_signal = portfolio_manager._create_hold_signal("test")
+
+        with pytest.raises(AttributeError):
+            hold_signal.action = "buy"
+
     @pytest.mark.asyncio
     async def test_combine_strategy_signals_empty(self, portfolio_manager):
         """Test att kombinera signaler när inga signaler finns."""
-        combined_signal = await portfolio_manager.combine_strategy_signals(
+        combined_signal = portfolio_manager.combine_strategy_signals(
             {}, "BTC/USD", 50000.0
         )
 
@@ -196,7 +290,7 @@ class TestPortfolioManagerAsyncSignals:
             ),
         }
 
-        combined_signal = await portfolio_manager.combine_strategy_signals(
+        combined_signal = portfolio_manager.combine_strategy_signals(
             signals, "BTC/USD", 50000.0
         )
 
@@ -221,10 +315,8 @@ class TestPortfolioManagerAsyncSignals:
             ),
         }
 
-        with patch(
-            "backend.services.portfolio_manager_async.logging.warning"
-        ) as mock_warn:
-            combined_signal = await portfolio_manager.combine_strategy_signals(
+        with patch("backend.services.portfolio_core.logger.warning") as mock_warn:
+            combined_signal = portfolio_manager.combine_strategy_signals(
                 signals, "BTC/USD", 50000.0
             )
 
@@ -235,6 +327,49 @@ class TestPortfolioManagerAsyncSignals:
             assert combined_signal.action == "hold"
             assert len(combined_signal.individual_signals) == 0
 
+    @pytest.mark.asyncio
+    async def test_process_signals_batches_risk_validation(
+        self, portfolio_manager, mock_risk_manager
+    ):
+        """Test att symboler storleksberäknas parallellt och valideras i ett anrop."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_position_size(
+            combined_signal, portfolio_value, positions, symbol
+        ):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 1000.0, {"symbol": symbol}
+
+        portfolio_manager.calculate_portfolio_position_size = slow_position_size
+        mock_risk_manager.validate_orders_batch.side_effect = lambda orders, **kwargs: [
+            {"valid": order["symbol"] == "BTC/USD", "errors": []} for order in orders
+        ]
+        signals = [
+            {
+                "symbol": symbol,
+                "source": "ema_crossover",
+                "signal_type": "buy",
+                "confidence": 0.8,
+                "price": price,
+                "indicators": {"probability_buy": 0.7, "probability_hold": 0.2},
+            }
+            for symbol, price in [("BTC/USD", 50000.0), ("ETH/USD", 3000.0)]
+        ]
+
+        actions = await portfolio_manager.process_signals(signals)
+
+        assert [a["symbol"] for a in actions] == ["BTC/USD", "ETH/USD"]
+        assert [a["price"] for a in actions] == [50000.0, 3000.0]
+        assert [a["should_execute"] for a in actions] == [True, False]
+        assert max_in_flight == 2
+        mock_risk_manager.validate_orders_batch.assert_awaited_once()
+        mock_risk_manager.validate_order_with_probabilities.assert_not_called()
+
 
 class TestPortfolioManagerAsyncPositionSizing:
     """Test positionsstorleksberäkning i PortfolioManagerAsync."""
@@ -288,17 +423,17 @@ class TestPortfolioManagerAsyncPositionSizing:
     async def test_calculate_diversification_factor(self, portfolio_manager):
         """Test beräkning av diversifieringsfaktor."""
         # Tomt portfölj = ingen diversifiering = faktor 1.0
-        factor = await portfolio_manager._calculate_diversification_factor({})
+        factor = portfolio_manager._calculate_diversification_factor({})
         assert factor == 1.0
 
         # Fler positioner bör ge lägre faktor (mindre position per tillgång)
         positions = {f"sym{i}": {"amount": 1.0} for i in range(3)}
-        factor = await portfolio_manager._calculate_diversification_factor(positions)
+        factor = portfolio_manager._calculate_diversification_factor(positions)
         assert factor < 1.0
 
         # Max antal positioner bör ge lägsta faktor
         positions = {f"sym{i}": {"amount": 1.0} for i in range(5)}
-        factor = await portfolio_manager._calculate_diversification_factor(positions)
+        factor = portfolio_manager._calculate_diversification_factor(positions)
         assert factor == 0.5  # Min-värdet enligt implementationen
 
 
@@ -383,12 +518,114 @@ class TestPortfolioManagerAsyncTradeExecution:
         assert metadata["risk_validation"]["valid"] is False
         assert len(metadata["risk_validation"]["errors"]) > 0
 
+    @pytest.mark.asyncio
+    async def test_should_execute_trade_hold_skips_risk_checks(
+        self, portfolio_manager, mock_risk_manager
+    ):
+        """Test att hold-signaler inte anropar riskhanteraren."""
+        hold_signal = portfolio_manager._create_hold_signal("test")
+
+        should_execute, metadata = await portfolio_manager.should_execute_trade(
+            hold_signal, 100000.0, {}, "BTC/USD", 50000.0
+        )
+
+        assert should_execute is False
+        assert metadata["reason"] == "hold_signal"
+        assert metadata["position_size"] == 0.0
+        mock_risk_manager.calculate_intelligent_position_size.assert_not_called()
+        mock_risk_manager.validate_order_with_probabilities.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_risk_manager_calls_respect_concurrency_limit(
+        self, mock_risk_manager, strategy_weights, mock_strategy_signals
+    ):
+        """Test att antalet samtidiga riskanrop begränsas."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_position_size(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 1000.0, {}
+
+        mock_risk_manager.calculate_intelligent_position_size.side_effect = (
+            slow_position_size
+        )
+        pm = PortfolioManagerAsync(
+            mock_risk_manager, strategy_weights, concurrency_limit=2
+        )
+        combined_signal = pm.combine_strategy_signals(
+            mock_strategy_signals, "BTC/USD", 50000.0
+        )
+
+        await asyncio.gather(
+            *(
+                pm.calculate_portfolio_position_size(
+                    combined_signal, 100000.0, {}, "BTC/USD"
+                )
+                for _ in range(6)
+            )
+        )
+
+        assert max_in_flight == 2
+
+
+class TestPortfolioManagerAsyncAllocations:
+    """Test för allokeringsberäkningar i PortfolioManagerAsync."""
+
+    @pytest.mark.asyncio
+    async def test_calculate_allocations_weights_by_confidence(self, portfolio_manager):
+        """Test att allokeringar viktas efter konfidens och riskprofil."""
+        portfolio_manager.process_signals = AsyncMock(
+            return_value=[
+                {
+                    "symbol": "BTC/USD",
+                    "action": "buy",
+                    "should_execute": True,
+                    "confidence": 0.6,
+                    "price": 50000.0,
+                },
+                {
+                    "symbol": "ETH/USD",
+                    "action": "buy",
+                    "should_execute": True,
+                    "confidence": 0.2,
+                    "price": 3000.0,
+                },
+                {
+                    "symbol": "SOL/USD",
+                    "action": "buy",
+                    "should_execute": False,
+                    "confidence": 0.9,
+                    "price": 100.0,
+                },
+                {
+                    "symbol": "XRP/USD",
+                    "action": "sell",
+                    "should_execute": True,
+                    "confidence": 0.9,
+                    "price": 0.5,
+                },
+            ]
+        )
+
+        allocations = await portfolio_manager.calculate_allocations(
+            [], risk_profile="aggressive", max_allocation_percent=0.8
+        )
+
+        assert [a["symbol"] for a in allocations] == ["BTC/USD", "ETH/USD"]
+        assert allocations[0]["percentage"] == pytest.approx(0.6)
+        assert allocations[1]["percentage"] == pytest.approx(0.2)
+        assert allocations[0]["target_allocation"] == allocations[0]["percentage"]
+
 
 class TestPortfolioManagerAsyncFactory:
     """Test för factory-funktioner relaterade till PortfolioManagerAsync."""
 
-    @pytest.mark.asyncio
-    async def test_get_portfolio_manager_async(self):
+    def test_get_portfolio_manager_async(self):
         """Test factory function get_portfolio_manager_async."""
         with patch(
             "backend.services.portfolio_manager_async.PortfolioManagerAsync"
@@ -408,7 +645,7 @@ class TestPortfolioManagerAsyncFactory:
                 get_portfolio_manager_async,
             )
 
-            portfolio_manager = await get_portfolio_manager_async(
+            portfolio_manager = get_portfolio_manager_async(
                 risk_manager=mock_risk_manager, strategy_weights=mock_strategy_weights
             )
 
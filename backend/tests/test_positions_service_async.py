@@ -0,0 +1,260 @@
+"""Tester för den asynkrona positionstjänsten."""
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+import backend.services.exchange_async as exchange_async
+import backend.services.positions_service as sync_positions_module
+import backend.services.positions_service_async as positions_module
+from backend.services.cache_service import get_cache_service
+from backend.services.serialization import loads
+
+
+@pytest.fixture
+def mock_exchange(monkeypatch):
+    """Mockad exchange med spot-innehav i BTC och TESTETH."""
+    exchange = MagicMock()
+    exchange.fetch_positions.return_value = []
+    exchange.fetch_balance.return_value = {"BTC": 0.5, "TESTETH": 2.0, "LTC": 0.0}
+    exchange.fetch_tickers.return_value = {
+        "BTC/USD": {"symbol": "BTC/USD", "last": 40000.0},
+        "ETH/USD": {"symbol": "ETH/USD", "last": 2000.0},
+    }
+    monkeypatch.setattr(exchange_async, "_exchange_instance", exchange)
+    monkeypatch.setattr(exchange_async, "_ticker_cache", {})
+    monkeypatch.setattr(
+        exchange_async, "_ticker_breaker", exchange_async._CircuitBreaker(3, 30.0)
+    )
+    monkeypatch.setattr(positions_module, "_fetched_at", OrderedDict())
+    get_cache_service().clear()
+    yield exchange
+    get_cache_service().clear()
+
+
+async def test_fetch_positions_uses_single_ticker_batch(mock_exchange):
+    """Test att priser för alla innehav hämtas med ett enda batch-anrop."""
+    positions = await positions_module.fetch_positions_async()
+
+    mock_exchange.fetch_tickers.assert_called_once_with(["ETH/USD", "BTC/USD"])
+    mock_exchange.fetch_ticker.assert_not_called()
+    assert [p["symbol"] for p in positions] == ["ETH/USD", "BTC/USD"]
+    assert positions[1]["notional"] == pytest.approx(20000.0)
+    assert positions[0]["mark_price"] == pytest.approx(2000.0)
+
+
+async def test_fetch_positions_keeps_margin_positions_when_balance_fails(
+    mock_exchange,
+):
+    """Test att marginpositioner returneras även om saldot inte kan hämtas."""
+    margin_position = {"symbol": "BTC/USD", "position_type": "margin"}
+    mock_exchange.fetch_positions.return_value = [margin_position]
+    mock_exchange.fetch_balance.side_effect = Exception("nonce error")
+
+    positions = await positions_module.fetch_positions_async()
+
+    assert positions == [margin_position]
+    mock_exchange.fetch_tickers.assert_not_called()
+
+
+async def test_fetch_positions_cache_ignores_symbol_order(mock_exchange):
+    """Test att samma symboler i annan ordning träffar samma cachepost."""
+    first = await positions_module.fetch_positions_async(["BTC/USD", "ETH/USD"])
+    second = await positions_module.fetch_positions_async(["ETH/USD", "BTC/USD"])
+
+    assert second == first
+    mock_exchange.fetch_balance.assert_called_once()
+
+
+async def test_fetch_positions_filters_by_symbols(mock_exchange):
+    """Test att endast positioner för efterfrågade symboler returneras."""
+    positions = await positions_module.fetch_positions_async(["BTC/USD", "XRP/USD"])
+
+    assert [p["symbol"] for p in positions] == ["BTC/USD"]
+
+
+async def test_concurrent_fetches_share_one_exchange_call(mock_exchange):
+    """Test att samtidiga anrop vid cachemiss delar på samma hämtning."""
+    results = await asyncio.gather(
+        *(positions_module.fetch_positions_async() for _ in range(5))
+    )
+
+    assert all(result == results[0] for result in results)
+    mock_exchange.fetch_balance.assert_called_once()
+    mock_exchange.fetch_tickers.assert_called_once()
+    assert positions_module._inflight_fetches[asyncio.get_running_loop()] == {}
+
+
+async def test_fetch_positions_skips_tickers_without_holdings(mock_exchange):
+    """Test att inga priser hämtas när inga valutor har saldo."""
+    mock_exchange.fetch_balance.return_value = {"BTC": 0.0, "USD": 1000.0}
+
+    positions = await positions_module.fetch_positions_async()
+
+    assert positions == []
+    mock_exchange.fetch_tickers.assert_not_called()
+
+
+async def test_fetch_positions_payload_is_cached_with_positions(mock_exchange):
+    """Test att den kodade svarskroppen cachas tillsammans med positionerna."""
+    positions, body = await positions_module.fetch_positions_payload_async()
+    cached_positions, cached_body = (
+        await positions_module.fetch_positions_payload_async()
+    )
+
+    assert loads(body) == {"positions": positions}
+    assert cached_body is body
+    assert cached_positions is positions
+    mock_exchange.fetch_balance.assert_called_once()
+
+
+async def test_fetch_positions_skips_holdings_without_ticker(mock_exchange):
+    """Test att innehav som saknas i batch-svaret hoppas över."""
+    mock_exchange.fetch_tickers.return_value = {
+        "BTC/USD": {"symbol": "BTC/USD", "last": 40000.0},
+    }
+
+    positions = await positions_module.fetch_positions_async()
+
+    assert [p["symbol"] for p in positions] == ["BTC/USD"]
+
+
+async def test_fetch_positions_without_batch_support_fetches_concurrently(
+    mock_exchange,
+):
+    """Test att priser hämtas per symbol när batch-anrop inte stöds."""
+    mock_exchange.exchange.has = {"fetchTickers": False}
+    mock_exchange.fetch_ticker.side_effect = lambda symbol: {
+        "BTC/USD": {"symbol": "BTC/USD", "last": 40000.0},
+    }[symbol]
+
+    positions = await positions_module.fetch_positions_async()
+
+    mock_exchange.fetch_tickers.assert_not_called()
+    assert mock_exchange.fetch_ticker.call_count == 2
+    assert [p["symbol"] for p in positions] == ["BTC/USD"]
+
+
+async def test_fetch_positions_reuses_recent_tickers(mock_exchange):
+    """Test att nyligen hämtade priser återanvänds mellan olika cachenycklar."""
+    await positions_module.fetch_positions_async()
+    await positions_module.fetch_positions_async(["BTC/USD"])
+
+    mock_exchange.fetch_tickers.assert_called_once()
+    assert mock_exchange.fetch_balance.call_count == 2
+
+
+async def test_fetch_positions_only_prices_requested_symbols(mock_exchange):
+    """Test att endast efterfrågade symboler prissätts."""
+    await positions_module.fetch_positions_async(["BTC/USD"])
+
+    mock_exchange.fetch_tickers.assert_called_once_with(["BTC/USD"])
+
+
+def test_build_position_sets_margin_fields_by_type():
+    """Test att marginalfält bara sätts för marginalklassade innehav."""
+    margin = positions_module._build_position(
+        "BTC", "BTC/USD", 0.5, 40000.0, "margin", 1, 1000
+    )
+    spot = positions_module._build_position(
+        "BTC", "BTC/USD", 0.5, 40000.0, "spot", 1, 1000
+    )
+
+    assert margin["id"] == "margin_BTC_1"
+    assert margin["margin_mode"] == "cross"
+    assert margin["maintenance_margin"] == pytest.approx(2000.0)
+    assert spot["id"] == "spot_BTC_1"
+    assert spot["margin_mode"] == "spot"
+    assert spot["maintenance_margin"] == 0.0
+
+
+async def test_fetch_positions_filters_margin_positions(mock_exchange):
+    """Test att marginalpositioner från börsen också filtreras på symbol."""
+    mock_exchange.fetch_positions.return_value = [
+        {"symbol": "ETH/USD", "position_type": "margin"},
+        {"symbol": "BTC/USD", "position_type": "margin"},
+    ]
+
+    positions = await positions_module.fetch_positions_async(["BTC/USD"])
+
+    assert [p["symbol"] for p in positions] == ["BTC/USD", "BTC/USD"]
+    assert positions[0]["position_type"] == "margin"
+    assert positions[1]["position_type"] == "spot"
+
+
+async def test_stale_positions_are_served_while_refreshing(mock_exchange, monkeypatch):
+    """Test att gamla positioner returneras direkt medan de uppdateras."""
+    first = await positions_module.fetch_positions_async()
+    monkeypatch.setitem(positions_module._fetched_at, "positions_all", 0.0)
+    mock_exchange.fetch_balance.return_value = {"BTC": 1.0}
+
+    stale = await positions_module.fetch_positions_async()
+    await positions_module._inflight_fetches[asyncio.get_running_loop()][
+        "positions_all"
+    ]
+    refreshed = await positions_module.fetch_positions_async()
+
+    assert stale is first
+    assert mock_exchange.fetch_balance.call_count == 2
+    assert [p["amount"] for p in refreshed] == [1.0]
+
+
+async def test_symbol_filters_cached_are_bounded(mock_exchange, monkeypatch):
+    """Test att antalet cachade symbolfilter är begränsat."""
+    monkeypatch.setattr(positions_module, "_MAX_CACHED_KEYS", 2)
+    cache = get_cache_service()
+
+    for symbol in ("BTC/USD", "ETH/USD", "LTC/USD"):
+        await positions_module.fetch_positions_async([symbol])
+
+    assert list(positions_module._fetched_at) == [
+        "positions_ETH/USD",
+        "positions_LTC/USD",
+    ]
+    assert cache.get("positions_BTC/USD") is None
+    assert cache.get("positions_LTC/USD") is not None
+
+
+async def test_fetches_are_not_shared_between_event_loops(mock_exchange):
+    """Test att en pågående hämtning från en annan loop inte återanvänds."""
+    other_loop = asyncio.new_event_loop()
+    try:
+        foreign = other_loop.create_future()
+        positions_module._inflight_fetches[other_loop] = {"positions_all": foreign}
+
+        positions = await positions_module.fetch_positions_async()
+    finally:
+        positions_module._inflight_fetches.pop(other_loop, None)
+        other_loop.close()
+
+    assert [p["symbol"] for p in positions] == ["ETH/USD", "BTC/USD"]
+
+
+def _fetch_live_positions_in_thread():
+    """Kör den synkrona hämtningen i en egen tråd, som en synkron anropare."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(sync_positions_module.fetch_live_positions).result()
+
+
+def test_sync_fetch_runs_each_call_on_its_own_loop(mock_exchange):
+    """Test att synkrona anrop fungerar upprepat och inte lämnar klienter kvar."""
+    first = _fetch_live_positions_in_thread()
+    get_cache_service().clear()
+    second = _fetch_live_positions_in_thread()
+
+    for positions in (first, second):
+        assert [p["symbol"] for p in positions] == ["ETH/USD", "BTC/USD"]
+    assert mock_exchange.fetch_balance.call_count == 2
+    assert len(exchange_async._http_clients) == 0
+
+
+def test_sync_fetch_does_not_initialize_exchange(monkeypatch):
+    """Test att den synkrona vägen inte skapar någon exchange själv."""
+    monkeypatch.setattr(exchange_async, "_exchange_instance", None)
+    get_cache_service().clear()
+
+    assert _fetch_live_positions_in_thread() == []
+    assert exchange_async.get_exchange_instance() is None
@@ -146,6 +146,56 @@ class TestRiskManagerAsyncBasic:
             assert saved_data["daily_pnl"] == 0.025
             assert saved_data["date"] == str(date.today())
 
+    @pytest.mark.asyncio
+    async def test_validate_orders_batch_matches_single(
+        self, risk_parameters, temp_file
+    ):
+        """Test att batchvalidering ger samma resultat som enskilda anrop."""
+        with open(temp_file, "w") as f:
+            json.dump({"date": str(date.today()), "daily_pnl": 0.0}, f)
+
+        manager = RiskManagerAsync(risk_parameters, persistence_file=temp_file)
+        await manager._load_daily_pnl()
+
+        orders = [
+            {"symbol": "BTC/USD", "side": "buy", "amount": 0.5, "price": 50000.0},
+            {"symbol": "ETH/USD", "side": "sell", "amount": 1.0, "price": 3000.0},
+        ]
+        probabilities = [
+            ProbabilityData(
+                probability_buy=0.7,
+                probability_sell=0.1,
+                probability_hold=0.2,
+                confidence=0.8,
+            ),
+            None,
+        ]
+
+        batch = await manager.validate_orders_batch(orders, 100000.0, {}, probabilities)
+        single = [
+            await manager.validate_order_with_probabilities(
+                order, 100000.0, {}, probability_data
+            )
+            for order, probability_data in zip(orders, probabilities)
+        ]
+
+        assert batch == single
+        assert [result["valid"] for result in batch] == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_validate_orders_batch_rejects_length_mismatch(
+        self, risk_parameters, temp_file
+    ):
+        """Test att olika långa listor ger fel i stället för att tappa ordrar."""
+        manager = RiskManagerAsync(risk_parameters, persistence_file=temp_file)
+        orders = [
+            {"symbol": "BTC/USD", "side": "buy", "amount": 0.5, "price": 50000.0},
+            {"symbol": "ETH/USD", "side": "sell", "amount": 1.0, "price": 3000.0},
+        ]
+
+        with pytest.raises(ValueError):
+            await manager.validate_orders_batch(orders, 100000.0, {}, [None])
+
 
 class TestRiskManagerAsyncValidation:
     """Tester för validering av ordrar med RiskManagerAsync."""
@@ -0,0 +1,59 @@
+"""Tester för JSON-serialisering med och utan orjson."""
+
+import datetime
+import uuid
+
+import numpy as np
+import pytest
+
+import backend.services.serialization as serialization
+
+BACKENDS = ["orjson", "json"]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    """Kör testet mot både orjson och json-reserven."""
+    if request.param == "orjson":
+        if serialization.orjson is None:
+            pytest.skip("orjson är inte installerat")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_dumps_matches_across_backends(backend):
+    """Test att båda backends ger samma JSON för vanliga API-värden."""
+    payload = {
+        "when": datetime.datetime(2024, 1, 2, 3, 4, 5, 600000),
+        "aware": datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc),
+        "day": datetime.date(2024, 1, 2),
+        "price": np.float64(40000.5),
+        "count": np.int64(3),
+        "id": uuid.UUID(int=1),
+        "name": "Växjö",
+    }
+
+    assert serialization.loads(serialization.dumps(payload)) == {
+        "when": "2024-01-02T03:04:05.600000",
+        "aware": "2024-01-02T00:00:00+00:00",
+        "day": "2024-01-02",
+        "price": 40000.5,
+        "count": 3,
+        "id": "00000000-0000-0000-0000-000000000001",
+        "name": "Växjö",
+    }
+
+
+def test_dumps_rejects_unsupported_types(backend):
+    """Test att okända typer ger TypeError i stället för str()."""
+    with pytest.raises(TypeError):
+        serialization.dumps({"value": object()})
+
+
+def test_json_fallback_rejects_nan(monkeypatch):
+    """Test att reserven vägrar NaN i stället för att skriva ogiltig JSON."""
+    monkeypatch.setattr(serialization, "orjson", None)
+
+    with pytest.raises(ValueError):
+        serialization.dumps({"pnl": float("nan")})